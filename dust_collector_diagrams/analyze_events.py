@@ -5,11 +5,18 @@ Extracts who publishes and who subscribes to what events.
 """
 
 import ast
+import fnmatch
 import os
+import re
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Callable, Dict, List, Optional, Set
 from dataclasses import dataclass, field
 
+# Generators stream straight into the output file; a large buffer keeps
+# the many small writes from turning into many small syscalls.
+_DOT_BUFFER_SIZE = 1 << 20
+
 
 @dataclass
 class EventInfo:
@@ -23,69 +30,244 @@ class ModuleInfo:
     """Information about a module."""
     name: str
     publishes: Set[str] = field(default_factory=set)
-    subscribes: Set[str] = field(default_factory=set)
+    subscribes: Set[str] = field(default_factory=set)  # event-type patterns
     imports: Set[str] = field(default_factory=set)
 
 
+# AST leaves are always exact node types, so the visitors use
+# `type(x) is ...` against these module-level bindings rather than repeated
+# isinstance() calls through the ast module namespace.
+_Assign = ast.Assign
+_AnnAssign = ast.AnnAssign
+_Attribute = ast.Attribute
+_Call = ast.Call
+_Constant = ast.Constant
+_Dict = ast.Dict
+_FunctionDef = ast.FunctionDef
+_IfExp = ast.IfExp
+_JoinedStr = ast.JoinedStr
+_FormattedValue = ast.FormattedValue
+_Name = ast.Name
+_Return = ast.Return
+_Subscript = ast.Subscript
+_SEQUENCE_NODES = (ast.Tuple, ast.List, ast.Set)
+
+# Event constructors whose first argument is the event type
+_EVENT_FACTORIES = ('now', 'now_d')
+# Calls that pass an event type (or a collection of them) straight through
+_PASSTHROUGH_CALLS = ('intern', 'frozenset', 'set', 'tuple', 'list')
+# Number of binding passes; enough for a constant built from a constant
+# built from a constant (e.g. a frozenset of EVT_* names).
+_BINDING_PASSES = 3
+
+Bindings = Dict[str, Set[str]]
+
+
+def _event_type_literal(node) -> Optional[str]:
+    """Return the event type spelled by a str / f-string node, else None."""
+    kind = type(node)
+    if kind is _Constant:
+        value = node.value
+        return value if type(value) is str else None
+    if kind is _JoinedStr:
+        # f-string like f"{tool}.on"
+        parts = []
+        for value in node.values:
+            value_kind = type(value)
+            if value_kind is _Constant:
+                parts.append(value.value)
+            elif value_kind is _FormattedValue:
+                parts.append("{...}")
+        return "".join(parts)
+    return None
+
+
+def _call_name(func) -> Optional[str]:
+    kind = type(func)
+    if kind is _Name:
+        return func.id
+    if kind is _Attribute:
+        return func.attr
+    return None
+
+
+def _resolve(node, local: Bindings, shared: Bindings) -> Set[str]:
+    """
+    Event types an expression can evaluate to, as far as static analysis
+    can tell: literals and f-strings, EVT_* style names and attributes bound
+    elsewhere, `a if c else b`, collections/dict keys of those, and
+    sys.intern()/frozenset()/... wrappers around them.
+    """
+    literal = _event_type_literal(node)
+    if literal is not None:
+        return {literal}
+    kind = type(node)
+    if kind is _Name:
+        return local.get(node.id) or shared.get(node.id) or set()
+    if kind is _Attribute:
+        return shared.get(node.attr) or set()
+    if kind is _IfExp:
+        return _resolve(node.body, local, shared) | _resolve(node.orelse, local, shared)
+    if kind in _SEQUENCE_NODES:
+        out: Set[str] = set()
+        for elt in node.elts:
+            out |= _resolve(elt, local, shared)
+        return out
+    if kind is _Dict:
+        out = set()
+        for key in node.keys:
+            if key is not None:
+                out |= _resolve(key, local, shared)
+        return out
+    if kind is _Call:
+        name = _call_name(node.func)
+        if name in _PASSTHROUGH_CALLS:
+            return _resolve(node.args[0], local, shared) if node.args else set()
+        if name is not None:
+            # Module function whose return value was resolved
+            return local.get(name + '()') or set()
+    return set()
+
+
+def _bind(table: Bindings, key: str, types: Set[str]) -> None:
+    if types:
+        table.setdefault(key, set()).update(types)
+
+
+def _collect_bindings(tree: ast.AST, local: Bindings, shared: Bindings) -> None:
+    """
+    Record what event types names can hold in this module (`local`) and
+    what attributes/keyword arguments can hold anywhere (`shared`, since
+    objects cross module boundaries: GateConfig(event_on=...) vs
+    self.config.event_on).
+    """
+    for _ in range(_BINDING_PASSES):
+        for node in ast.walk(tree):
+            kind = type(node)
+            if kind is _Assign or kind is _AnnAssign:
+                value = node.value
+                if value is None:
+                    continue
+                targets = node.targets if kind is _Assign else [node.target]
+                if type(value) is _Attribute and value.attr == 'type':
+                    # ev_type = ev.type: comparisons on the alias filter events
+                    for target in targets:
+                        if type(target) is _Name:
+                            local.setdefault('.type', set()).add(target.id)
+                    continue
+                types = _resolve(value, local, shared)
+                for target in targets:
+                    target_kind = type(target)
+                    if target_kind is _Name:
+                        _bind(local, target.id, types)
+                    elif target_kind is _Attribute:
+                        _bind(shared, target.attr, types)
+                    elif target_kind is _Subscript and type(target.value) is _Name:
+                        # dispatch[sys.intern(f"{tool}.on")] = ...: dict keys
+                        _bind(local, target.value.id,
+                              _resolve(target.slice, local, shared))
+            elif kind is _Call:
+                for kw in node.keywords:
+                    if kw.arg is not None and kw.arg != 'types':
+                        _bind(shared, kw.arg, _resolve(kw.value, local, shared))
+            elif kind is _FunctionDef:
+                for sub in ast.walk(node):
+                    if type(sub) is _Return and sub.value is not None:
+                        _bind(local, node.name + '()',
+                              _resolve(sub.value, local, shared))
+
+
 class EventAnalyzer(ast.NodeVisitor):
     """AST visitor to extract event publishing patterns."""
     
-    def __init__(self, module_name: str):
+    def __init__(self, module_name: str, local: Optional[Bindings] = None,
+                 shared: Optional[Bindings] = None):
         self.module_name = module_name
+        self.local: Bindings = local if local is not None else {}
+        self.shared: Bindings = shared if shared is not None else {}
+        self.type_aliases: Set[str] = self.local.get('.type', set())
         self.publishes: Set[str] = set()
-        self.subscribes = False
+        self.subscribes = 0  # number of .subscribe() calls
+        self.subscribes_to: Set[str] = set()
         self.imports: Set[str] = set()
     
+    def _resolve(self, node) -> Set[str]:
+        return _resolve(node, self.local, self.shared)
+    
     def visit_Call(self, node):
-        # Look for bus.publish(Event.now("event.type", ...))
-        if (isinstance(node.func, ast.Attribute) and 
-            node.func.attr == 'publish'):
-            # Check if first arg is Event.now()
-            if node.args and isinstance(node.args[0], ast.Call):
-                event_call = node.args[0]
-                if (isinstance(event_call.func, ast.Attribute) and
-                    event_call.func.attr == 'now' and
-                    event_call.args):
-                    # First arg to Event.now is the event type
-                    event_type_node = event_call.args[0]
-                    if isinstance(event_type_node, ast.Constant):
-                        self.publishes.add(event_type_node.value)
-                    elif isinstance(event_type_node, ast.JoinedStr):
-                        # f-string like f"{tool}.on"
-                        parts = []
-                        for value in event_type_node.values:
-                            if isinstance(value, ast.Constant):
-                                parts.append(value.value)
-                            elif isinstance(value, ast.FormattedValue):
-                                parts.append("{...}")
-                        self.publishes.add("".join(parts))
-        
-        # Look for bus.subscribe()
-        if (isinstance(node.func, ast.Attribute) and 
-            node.func.attr == 'subscribe'):
-            self.subscribes = True
+        func = node.func
+        if type(func) is _Attribute:
+            attr = func.attr
+            args = node.args
+            if attr == 'publish':
+                # Look for bus.publish(Event.now(<type>, ...)) / now_d(...)
+                if args and type(args[0]) is _Call:
+                    event_call = args[0]
+                    event_func = event_call.func
+                    if (type(event_func) is _Attribute and
+                        event_func.attr in _EVENT_FACTORIES and
+                        event_call.args):
+                        # First arg to Event.now/now_d is the event type
+                        self.publishes |= self._resolve(event_call.args[0])
+            elif attr == 'subscribe':
+                # Look for bus.subscribe("event.type") / bus.subscribe()
+                # and bus.subscribe(types=(...)) / types=<dispatch dict>
+                self.subscribes += 1
+                if args:
+                    self.subscribes_to |= self._resolve(args[0])
+                for kw in node.keywords:
+                    if kw.arg == 'types':
+                        self.subscribes_to |= self._resolve(kw.value)
         
         self.generic_visit(node)
     
+    def visit_Compare(self, node):
+        # Unfiltered subscribers check ev.type == X / ev.type in (X, Y)
+        # (or an ev_type = ev.type alias). Those types are what the module
+        # actually subscribes to.
+        left = node.left
+        left_kind = type(left)
+        if ((left_kind is _Attribute and left.attr == 'type') or
+                (left_kind is _Name and left.id in self.type_aliases)):
+            for comparator in node.comparators:
+                self.subscribes_to |= self._resolve(comparator)
+        self.generic_visit(node)
+    
     def visit_ImportFrom(self, node):
         if node.module:
             self.imports.add(node.module)
         self.generic_visit(node)
 
 
-def analyze_file(filepath: Path, module_name: str) -> ModuleInfo:
+def _parse(filepath: Path) -> ast.AST:
+    with open(filepath, 'r') as f:
+        return ast.parse(f.read(), filename=str(filepath))
+
+
+def analyze_file(filepath: Path, module_name: str,
+                 shared: Optional[Bindings] = None,
+                 tree: Optional[ast.AST] = None) -> ModuleInfo:
     """Analyze a single Python file."""
     try:
-        with open(filepath, 'r') as f:
-            tree = ast.parse(f.read(), filename=str(filepath))
+        if tree is None:
+            tree = _parse(filepath)
+        if shared is None:
+            shared = {}
+        local: Bindings = {}
+        _collect_bindings(tree, local, shared)
         
-        analyzer = EventAnalyzer(module_name)
+        analyzer = EventAnalyzer(module_name, local, shared)
         analyzer.visit(tree)
         
+        subscribes: Set[str] = set()
+        if analyzer.subscribes:
+            # A subscriber with no recognizable filter sees everything
+            subscribes = analyzer.subscribes_to or {'*'}
+        
         return ModuleInfo(
             name=module_name,
             publishes=analyzer.publishes,
-            subscribes=set(['*']) if analyzer.subscribes else set(),
+            subscribes=subscribes,
             imports=analyzer.imports
         )
     except Exception as e:
@@ -95,13 +277,13 @@ def analyze_file(filepath: Path, module_name: str) -> ModuleInfo:
 
 def analyze_codebase(src_path: Path) -> Dict[str, ModuleInfo]:
     """Analyze all Python files in the codebase."""
-    modules = {}
+    files: Dict[str, Path] = {}
     
-    for root, dirs, files in os.walk(src_path):
+    for root, dirs, filenames in os.walk(src_path):
         # Skip __pycache__
         dirs[:] = [d for d in dirs if d != '__pycache__']
         
-        for file in files:
+        for file in filenames:
             if file.endswith('.py'):
                 filepath = Path(root) / file
                 rel_path = filepath.relative_to(src_path.parent)
@@ -113,13 +295,38 @@ def analyze_codebase(src_path: Path) -> Dict[str, ModuleInfo]:
                 else:
                     parts[-1] = parts[-1][:-3]  # Remove .py
                 
-                module_name = '.'.join(parts)
-                modules[module_name] = analyze_file(filepath, module_name)
+                files['.'.join(parts)] = filepath
+    
+    # Publish sites and filters use constants (events.EVT_*) and objects
+    # (GateConfig.event_on) defined in other modules, so bindings from every
+    # module are gathered before any module is analyzed.
+    trees: Dict[str, ast.AST] = {}
+    shared: Bindings = {}
+    for module_name, filepath in files.items():
+        try:
+            trees[module_name] = tree = _parse(filepath)
+        except Exception:
+            continue  # reported by analyze_file below
+        module_level: Bindings = {}
+        _collect_bindings(tree, module_level, shared)
+        # Module-level constants are importable, so share them too
+        for stmt in tree.body:
+            if type(stmt) in (_Assign, _AnnAssign):
+                targets = stmt.targets if type(stmt) is _Assign else [stmt.target]
+                for target in targets:
+                    if type(target) is _Name and target.id in module_level:
+                        _bind(shared, target.id, module_level[target.id])
+    
+    modules = {}
+    for module_name, filepath in files.items():
+        modules[module_name] = analyze_file(
+            filepath, module_name, shared, trees.get(module_name))
     
     return modules
 
 
-def generate_event_flow_dot(modules: Dict[str, ModuleInfo]) -> str:
+def generate_event_flow_dot(modules: Dict[str, ModuleInfo],
+                            write: Callable[[str], None]) -> None:
     """Generate a Graphviz DOT file showing event flow."""
     
     # Collect all events
@@ -129,37 +336,48 @@ def generate_event_flow_dot(modules: Dict[str, ModuleInfo]) -> str:
             if event_type not in events:
                 events[event_type] = EventInfo()
             events[event_type].publishers.add(module.name)
-        
-        if module.subscribes:
-            # Module subscribes to all events it doesn't publish
-            for event_type in events:
-                if module.name not in events[event_type].publishers:
-                    events[event_type].subscribers.add(module.name)
-    
-    lines = [
-        'digraph EventFlow {',
-        '  rankdir=LR;',
-        '  node [shape=box, style=rounded];',
-        '  ',
-        '  // Event nodes',
-    ]
+    
+    # Match subscription patterns against the published event types; an
+    # f-string placeholder ("{...}") matches any text on either side.
+    event_matchers = {
+        event_type: re.compile(
+            fnmatch.translate(event_type.replace('{...}', '*'))).match
+        for event_type in events
+    }
+    for module in modules.values():
+        for pattern in module.subscribes:
+            matcher = re.compile(
+                fnmatch.translate(pattern.replace('{...}', '*'))).match
+            for event_type, info in events.items():
+                if module.name in info.publishers:
+                    continue
+                if matcher(event_type) or event_matchers[event_type](pattern):
+                    info.subscribers.add(module.name)
+    
+    write(
+        'digraph EventFlow {\n'
+        '  rankdir=LR;\n'
+        '  node [shape=box, style=rounded];\n'
+        '  \n'
+        '  // Event nodes\n'
+    )
     
     for event_type in sorted(events.keys()):
         safe_name = event_type.replace('.', '_').replace('{', '').replace('}', '').replace(' ', '')
-        lines.append(f'  evt_{safe_name} [label="{event_type}", shape=ellipse, fillcolor=lightyellow, style=filled];')
+        write(f'  evt_{safe_name} [label="{event_type}", shape=ellipse, fillcolor=lightyellow, style=filled];\n')
     
-    lines.append('  ')
-    lines.append('  // Publishers')
+    write('  \n')
+    write('  // Publishers\n')
     
     for event_type, info in sorted(events.items()):
         safe_event = event_type.replace('.', '_').replace('{', '').replace('}', '').replace(' ', '')
         for pub in sorted(info.publishers):
             safe_pub = pub.replace('.', '_')
-            lines.append(f'  {safe_pub} [fillcolor=lightblue, style=filled];')
-            lines.append(f'  {safe_pub} -> evt_{safe_event} [color=blue];')
+            write(f'  {safe_pub} [fillcolor=lightblue, style=filled];\n')
+            write(f'  {safe_pub} -> evt_{safe_event} [color=blue];\n')
     
-    lines.append('  ')
-    lines.append('  // Subscribers')
+    write('  \n')
+    write('  // Subscribers\n')
     
     for event_type, info in sorted(events.items()):
         safe_event = event_type.replace('.', '_').replace('{', '').replace('}', '').replace(' ', '')
@@ -167,64 +385,66 @@ def generate_event_flow_dot(modules: Dict[str, ModuleInfo]) -> str:
             if sub == '*':
                 continue
             safe_sub = sub.replace('.', '_')
-            lines.append(f'  {safe_sub} [fillcolor=lightgreen, style=filled];')
-            lines.append(f'  evt_{safe_event} -> {safe_sub} [color=green];')
+            write(f'  {safe_sub} [fillcolor=lightgreen, style=filled];\n')
+            write(f'  evt_{safe_event} -> {safe_sub} [color=green];\n')
     
-    lines.append('}')
-    return '\n'.join(lines)
+    write('}\n')
 
 
-def generate_component_diagram(modules: Dict[str, ModuleInfo]) -> str:
+def generate_component_diagram(modules: Dict[str, ModuleInfo],
+                               write: Callable[[str], None]) -> None:
     """Generate a component architecture diagram."""
     
-    lines = [
-        'digraph ComponentArchitecture {',
-        '  rankdir=TB;',
-        '  node [shape=component, style=filled];',
-        '  compound=true;',
-        '  ',
-        '  subgraph cluster_hardware {',
-        '    label="Hardware Layer";',
-        '    style=filled;',
-        '    fillcolor=lightgrey;',
-    ]
-    
-    hw_modules = [m for m in modules.keys() if m.startswith('src.hardware')]
-    for mod in sorted(hw_modules):
+    write(
+        'digraph ComponentArchitecture {\n'
+        '  rankdir=TB;\n'
+        '  node [shape=component, style=filled];\n'
+        '  compound=true;\n'
+        '  \n'
+        '  subgraph cluster_hardware {\n'
+        '    label="Hardware Layer";\n'
+        '    style=filled;\n'
+        '    fillcolor=lightgrey;\n'
+    )
+    
+    # One classification pass instead of a list comprehension per layer
+    by_layer = defaultdict(list)
+    for m in modules:
+        if m.startswith('src.hardware'):
+            by_layer['hardware'].append(m)
+        elif m.startswith('src.tasks'):
+            by_layer['tasks'].append(m)
+        elif not m.startswith('src.util') and m != 'src':
+            by_layer['core'].append(m)
+    
+    for mod in sorted(by_layer['hardware']):
         safe_name = mod.replace('.', '_')
         display_name = mod.split('.')[-1]
-        lines.append(f'    {safe_name} [label="{display_name}", fillcolor=lightblue];')
+        write(f'    {safe_name} [label="{display_name}", fillcolor=lightblue];\n')
     
-    lines.append('  }')
-    lines.append('  ')
-    lines.append('  subgraph cluster_tasks {')
-    lines.append('    label="Task Layer";')
-    lines.append('    style=filled;')
-    lines.append('    fillcolor=lightyellow;')
+    write('  }\n')
+    write('  \n')
+    write('  subgraph cluster_tasks {\n')
+    write('    label="Task Layer";\n')
+    write('    style=filled;\n')
+    write('    fillcolor=lightyellow;\n')
     
-    task_modules = [m for m in modules.keys() if m.startswith('src.tasks')]
-    for mod in sorted(task_modules):
+    for mod in sorted(by_layer['tasks']):
         safe_name = mod.replace('.', '_')
         display_name = mod.split('.')[-1]
-        lines.append(f'    {safe_name} [label="{display_name}", fillcolor=lightgreen];')
+        write(f'    {safe_name} [label="{display_name}", fillcolor=lightgreen];\n')
     
-    lines.append('  }')
-    lines.append('  ')
-    lines.append('  // Core components')
+    write('  }\n')
+    write('  \n')
+    write('  // Core components\n')
     
-    core_modules = [m for m in modules.keys() 
-                   if not m.startswith('src.hardware') 
-                   and not m.startswith('src.tasks')
-                   and not m.startswith('src.util')
-                   and m != 'src']
-    
-    for mod in sorted(core_modules):
+    for mod in sorted(by_layer['core']):
         safe_name = mod.replace('.', '_')
         display_name = mod.split('.')[-1]
-        lines.append(f'  {safe_name} [label="{display_name}", fillcolor=orange, shape=box];')
+        write(f'  {safe_name} [label="{display_name}", fillcolor=orange, shape=box];\n')
     
-    lines.append('  ')
-    lines.append('  // Dependencies')
+    write('  \n')
+    write('  // Dependencies\n')
     
     for mod_name, mod_info in sorted(modules.items()):
         if mod_name.startswith('src.tasks'):
@@ -234,70 +454,68 @@ def generate_component_diagram(modules: Dict[str, ModuleInfo]) -> str:
                     hw_mod = f'src.hardware.{imp.split(".")[-1]}'
                     if hw_mod in modules:
                         safe_to = hw_mod.replace('.', '_')
-                        lines.append(f'  {safe_from} -> {safe_to} [style=dashed];')
+                        write(f'  {safe_from} -> {safe_to} [style=dashed];\n')
     
-    lines.append('}')
-    return '\n'.join(lines)
+    write('}\n')
 
 
-def generate_module_deps(modules: Dict[str, ModuleInfo]) -> str:
+def generate_module_deps(modules: Dict[str, ModuleInfo],
+                         write: Callable[[str], None]) -> None:
     """Generate a module dependency graph."""
     
-    lines = [
-        'digraph ModuleDependencies {',
-        '  rankdir=LR;',
-        '  node [shape=box, style="rounded,filled"];',
-        '  ',
-    ]
+    write(
+        'digraph ModuleDependencies {\n'
+        '  rankdir=LR;\n'
+        '  node [shape=box, style="rounded,filled"];\n'
+        '  \n'
+    )
+    
+    # Split every module name once; both passes below reuse it
+    mod_parts = {name: tuple(name.split('.')) for name in modules}
     
     # Group by directory
-    by_dir = {}
-    for mod_name in modules:
-        parts = mod_name.split('.')
+    by_dir = defaultdict(list)
+    for mod_name, parts in mod_parts.items():
         if len(parts) > 1:
-            dir_name = '.'.join(parts[:-1])
-            if dir_name not in by_dir:
-                by_dir[dir_name] = []
-            by_dir[dir_name].append(mod_name)
+            by_dir[mod_name.rpartition('.')[0]].append(mod_name)
     
     for dir_name, mods in sorted(by_dir.items()):
         cluster_name = dir_name.replace('.', '_')
-        lines.append(f'  subgraph cluster_{cluster_name} {{')
-        lines.append(f'    label="{dir_name}";')
-        lines.append('    style=filled;')
-        lines.append('    fillcolor=lightgrey;')
+        write(f'  subgraph cluster_{cluster_name} {{\n')
+        write(f'    label="{dir_name}";\n')
+        write('    style=filled;\n')
+        write('    fillcolor=lightgrey;\n')
         
         for mod in sorted(mods):
             safe_name = mod.replace('.', '_')
             display_name = mod.split('.')[-1]
-            lines.append(f'    {safe_name} [label="{display_name}", fillcolor=white];')
+            write(f'    {safe_name} [label="{display_name}", fillcolor=white];\n')
         
-        lines.append('  }')
+        write('  }\n')
     
-    lines.append('  ')
-    lines.append('  // Dependencies')
+    write('  \n')
+    write('  // Dependencies\n')
     
     for mod_name, mod_info in sorted(modules.items()):
         safe_from = mod_name.replace('.', '_')
         for imp in mod_info.imports:
             # Try to resolve relative imports
             if imp.startswith('..'):
-                parts = mod_name.split('.')[:-1]  # Remove current module
-                imp_parts = imp.split('.')
+                parts = mod_parts[mod_name]
+                rest = imp.lstrip('.')
                 
-                # Go up directories
-                while imp_parts and imp_parts[0] == '':
-                    imp_parts = imp_parts[1:]
-                    if parts:
-                        parts = parts[:-1]
-                
-                target = '.'.join(parts + imp_parts)
+                # Drop the current module, then go up one package per dot
+                end = max(len(parts) - 1 - (len(imp) - len(rest)), 0)
+                package = '.'.join(parts[:end])
+                if package and rest:
+                    target = f'{package}.{rest}'
+                else:
+                    target = package or rest
                 if target in modules:
                     safe_to = target.replace('.', '_')
-                    lines.append(f'  {safe_from} -> {safe_to};')
+                    write(f'  {safe_from} -> {safe_to};\n')
     
-    lines.append('}')
-    return '\n'.join(lines)
+    write('}\n')
 
 
 def main():
@@ -310,23 +528,20 @@ def main():
     
     # Generate event flow diagram
     print("Generating event flow diagram...")
-    event_dot = generate_event_flow_dot(modules)
-    with open('event_flow.dot', 'w') as f:
-        f.write(event_dot)
+    with open('event_flow.dot', 'w', buffering=_DOT_BUFFER_SIZE) as f:
+        generate_event_flow_dot(modules, f.write)
     print("  -> event_flow.dot")
     
     # Generate component diagram
     print("Generating component architecture diagram...")
-    component_dot = generate_component_diagram(modules)
-    with open('component_architecture.dot', 'w') as f:
-        f.write(component_dot)
+    with open('component_architecture.dot', 'w', buffering=_DOT_BUFFER_SIZE) as f:
+        generate_component_diagram(modules, f.write)
     print("  -> component_architecture.dot")
     
     # Generate module dependencies
     print("Generating module dependency diagram...")
-    module_dot = generate_module_deps(modules)
-    with open('module_dependencies.dot', 'w') as f:
-        f.write(module_dot)
+    with open('module_dependencies.dot', 'w', buffering=_DOT_BUFFER_SIZE) as f:
+        generate_module_deps(modules, f.write)
     print("  -> module_dependencies.dot")
     
     # Print summary
@@ -11,8 +11,11 @@ Design goals:
 
 from __future__ import annotations
 
+import functools
+import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 TARGET_BRANCH = "v2-architecture"
@@ -27,6 +30,32 @@ SUSPICIOUS_PATTERNS = (
     "/__pycache__/",
 )
 
+# One case-insensitive alternation scans the change list once for all patterns.
+_SUSPICIOUS_RE = re.compile(
+    "|".join(re.escape(p) for p in SUSPICIOUS_PATTERNS), re.IGNORECASE
+)
+
+_STATUS_MARKER = "---STATUS---"
+_STAGED_MARKER = "---STAGED---"
+_FAILED_MARKER = "---FAILED---"
+_STAGE_ADD = "git add -A"
+
+
+def _stage_step(cmd: str) -> str:
+    """Shell fragment that runs `cmd` and, on failure, names it and exits."""
+    return f"{cmd} || {{ echo '{_FAILED_MARKER} {cmd}'; exit 1; }}"
+
+
+_STAGE_PIPELINE = "; ".join(
+    (
+        _stage_step(_STAGE_ADD),
+        f"echo '{_STATUS_MARKER}'",
+        _stage_step("git status -sb"),
+        f"echo '{_STAGED_MARKER}'",
+        _stage_step("git diff --name-only --cached"),
+    )
+)
+
 
 def run_git(args: List[str], capture: bool = True) -> str:
     """Run a git command. Raise on failure. Optionally capture stdout."""
@@ -44,28 +73,81 @@ def run_git(args: List[str], capture: bool = True) -> str:
         raise
 
 
+def run_git_bytes(args: List[str]) -> bytes:
+    """Run a git command and return raw stdout. Raise on failure.
+
+    For output that is only passed through to the terminal (diffs): no
+    decode/encode round trip, and binary diffs cannot raise
+    UnicodeDecodeError.
+    """
+    cmd = ["git"] + args
+    proc = subprocess.run(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=-1
+    )
+    if proc.returncode != 0:
+        print("\n[git error]")
+        print(f"$ {' '.join(cmd)}")
+        print(proc.stderr.decode(errors="replace"))
+        raise subprocess.CalledProcessError(
+            proc.returncode, cmd, proc.stdout, proc.stderr
+        )
+    return proc.stdout
+
+
 def ensure_in_repo() -> str:
     """Ensure we are inside a git repo and return its top-level directory."""
+    return _repo_identity()[0]
+
+
+@functools.lru_cache(maxsize=1)
+def _repo_identity() -> tuple[str, str]:
+    """Return (top-level directory, current branch) from one `git rev-parse`.
+
+    Cached for the menu session; only paths that move HEAD (sync, new
+    branch) call `_repo_identity.cache_clear()`.
+    """
     try:
-        top = (
-            subprocess.check_output(
-                ["git", "rev-parse", "--show-toplevel"],
-                stderr=subprocess.STDOUT,
-                text=True,
-            )
-            .strip()
+        out = subprocess.check_output(
+            ["git", "rev-parse", "--show-toplevel", "--abbrev-ref", "HEAD"],
+            stderr=subprocess.DEVNULL,
+            text=True,
         )
+    except subprocess.CalledProcessError:
+        # Also fails on an unborn HEAD (fresh repo, no commits yet), so
+        # only a failing --show-toplevel means we are not in a repo.
+        return _toplevel(), _unborn_branch()
+    top, branch = out.splitlines()[:2]
+    return top, branch
+
+
+def _toplevel() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--show-toplevel"],
+            stderr=subprocess.STDOUT,
+            text=True,
+        ).strip()
     except subprocess.CalledProcessError as exc:
         print("Error: this does not appear to be inside a git repository.")
         print(exc.output)
         sys.exit(1)
-    return top
+
+
+def _unborn_branch() -> str:
+    """Branch HEAD points at when it has no commit yet ("HEAD" if none)."""
+    try:
+        return subprocess.check_output(
+            ["git", "symbolic-ref", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except subprocess.CalledProcessError:
+        return "HEAD"
 
 
 def get_current_branch() -> str:
     """Return the current branch name."""
-    out = run_git(["rev-parse", "--abbrev-ref", "HEAD"])
-    return out.strip()
+    return _repo_identity()[1]
 
 
 def working_tree_clean() -> bool:
@@ -80,6 +162,14 @@ def print_cmd_block(title: str, cmd: List[str]) -> None:
     print(run_git(cmd).rstrip())
 
 
+def print_cmd_block_bytes(title: str, cmd: List[str]) -> None:
+    print(f"\n--- {title} ---")
+    print(f"$ {' '.join(['git'] + cmd)}", flush=True)
+    out = run_git_bytes(cmd).rstrip()
+    sys.stdout.buffer.write(out + b"\n")
+    sys.stdout.buffer.flush()
+
+
 def list_porcelain() -> str:
     """Return `git status --porcelain` output."""
     return run_git(["status", "--porcelain"]).rstrip()
@@ -97,33 +187,46 @@ def list_staged_files() -> str:
 
 def show_status() -> None:
     """Show where we are and current status."""
-    top = ensure_in_repo()
-    branch = get_current_branch()
+    # The queries are read-only and independent, so overlap their process
+    # startup; results are still printed in a fixed order.
+    status_cmd = ["status", "-sb"]
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        identity = pool.submit(_repo_identity)
+        status = pool.submit(run_git, status_cmd)
+        # Not run_git: its error report would print out of order from here.
+        log = pool.submit(
+            subprocess.check_output,
+            ["git", "log", "-8", "--oneline", "--decorate", TARGET_BRANCH],
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
 
-    print("\n=== Repository status ===")
-    print(f"Repo root: {top}")
-    print(f"Current branch: {branch}")
+        top, branch = identity.result()
+        print("\n=== Repository status ===")
+        print(f"Repo root: {top}")
+        print(f"Current branch: {branch}")
 
-    print_cmd_block("git status -sb", ["status", "-sb"])
+        print("\n--- git status -sb ---")
+        print(f"$ {' '.join(['git'] + status_cmd)}")
+        print(status.result().rstrip())
 
-    print(f"\n--- Last 8 commits on {TARGET_BRANCH} ---")
-    try:
-        log_out = run_git(["log", "-8", "--oneline", "--decorate", TARGET_BRANCH])
-        print(log_out.rstrip())
-    except Exception:
-        print(f"(No log found for branch {TARGET_BRANCH}?)")
+        print(f"\n--- Last 8 commits on {TARGET_BRANCH} ---")
+        try:
+            print(log.result().rstrip())
+        except Exception:
+            print(f"(No log found for branch {TARGET_BRANCH}?)")
 
     print("========================\n")
 
 
 def show_diff_unstaged() -> None:
     ensure_in_repo()
-    print_cmd_block("git diff (unstaged)", ["diff"])
+    print_cmd_block_bytes("git diff (unstaged)", ["diff"])
 
 
 def show_diff_staged() -> None:
     ensure_in_repo()
-    print_cmd_block("git diff --cached (staged)", ["diff", "--cached"])
+    print_cmd_block_bytes("git diff --cached (staged)", ["diff", "--cached"])
 
 
 def ensure_on_target_branch() -> bool:
@@ -151,35 +254,44 @@ def sync_from_origin() -> None:
     print(f"\n== Syncing branch '{TARGET_BRANCH}' from origin ==")
 
     print("\n[1] git fetch origin")
-    run_git(["fetch", "origin"], capture=False)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        fetch = pool.submit(run_git, ["fetch", "origin"], capture=False)
+        current_future = pool.submit(get_current_branch)
+        fetch.result()
 
-    current = get_current_branch()
-    if current != TARGET_BRANCH:
-        print(f"\n[2] git checkout {TARGET_BRANCH}")
+    try:
+        current = current_future.result()
+        if current != TARGET_BRANCH:
+            print(f"\n[2] git checkout {TARGET_BRANCH}")
+            try:
+                run_git(["checkout", TARGET_BRANCH], capture=False)
+            except Exception:
+                print(f"\nCould not checkout {TARGET_BRANCH}. Does it exist locally?\n")
+                return
+
+        print(f"\n[3] git pull --ff-only origin {TARGET_BRANCH}")
         try:
-            run_git(["checkout", TARGET_BRANCH], capture=False)
+            run_git(["pull", "--ff-only", "origin", TARGET_BRANCH], capture=False)
         except Exception:
-            print(f"\nCould not checkout {TARGET_BRANCH}. Does it exist locally?\n")
+            print(
+                "\nPull failed (local and remote likely diverged).\n"
+                "Stop and resolve manually (or ask Bob).\n"
+            )
             return
 
-    print(f"\n[3] git pull --ff-only origin {TARGET_BRANCH}")
-    try:
-        run_git(["pull", "--ff-only", "origin", TARGET_BRANCH], capture=False)
-    except Exception:
-        print(
-            "\nPull failed (local and remote likely diverged).\n"
-            "Stop and resolve manually (or ask Bob).\n"
-        )
-        return
-
-    print("\n== Sync complete ==\n")
+        print("\n== Sync complete ==\n")
+    finally:
+        # checkout may have moved HEAD
+        _repo_identity.cache_clear()
 
 
 def _refuse_if_suspicious(files_text: str) -> bool:
     if not REFUSE_SUSPICIOUS_STAGE:
         return False
-    lower = files_text.lower()
-    hits = [p for p in SUSPICIOUS_PATTERNS if p.lower() in lower]
+    if _SUSPICIOUS_RE.search(files_text) is None:
+        return False
+    found = {m.group(0).lower() for m in _SUSPICIOUS_RE.finditer(files_text)}
+    hits = [p for p in SUSPICIOUS_PATTERNS if p.lower() in found]
     if hits:
         print("\nRefusing to stage because suspicious junk appears in changes:")
         for h in hits:
@@ -191,10 +303,12 @@ def _refuse_if_suspicious(files_text: str) -> bool:
 
 def add_and_commit() -> None:
     """Add files and commit with a message (with preview)."""
-    ensure_in_repo()
+    _, branch = _repo_identity()
 
+    # The porcelain listing below already carries what `status -sb` would
+    # show before staging; the branch comes from the cached identity.
     print("\n=== Pre-commit review ===")
-    print_cmd_block("git status -sb", ["status", "-sb"])
+    print(f"Current branch: {branch}")
 
     porcelain = list_porcelain()
     if porcelain.strip() == "":
@@ -220,16 +334,35 @@ def add_and_commit() -> None:
         return
 
     print("\n[1] git add -A")
-    try:
-        run_git(["add", "-A"], capture=False)
-    except Exception:
-        print("\nStaging failed.\n")
+    # One shell pipeline instead of three git spawns; markers split the output.
+    proc = subprocess.run(
+        ["sh", "-c", _STAGE_PIPELINE],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    out = proc.stdout
+    if proc.returncode != 0:
+        out, _, failed = out.partition(_FAILED_MARKER + " ")
+        step = failed.strip() or "sh -c"
+        for marker in (_STATUS_MARKER, _STAGED_MARKER):
+            out = out.replace(marker + "\n", "")
+        if out.strip():
+            print(out.rstrip())
+        if step == _STAGE_ADD:
+            print("\nStaging failed.\n")
+        else:
+            print(f"\nFiles were staged, but '{step}' failed.\n")
         return
+    added, _, rest = out.partition(_STATUS_MARKER + "\n")
+    if added.strip():
+        print(added.rstrip())
+    status, _, staged = rest.partition(_STAGED_MARKER + "\n")
 
     print("\n--- Status AFTER staging ---")
-    print(run_git(["status", "-sb"]).rstrip())
+    print(status.rstrip())
 
-    staged = list_staged_files()
+    staged = staged.rstrip()
     print("\n--- Staged files ---")
     print(staged if staged else "(none?)")
 
@@ -288,14 +421,17 @@ def create_branch_from_target() -> None:
     print("\n[1] git fetch origin")
     run_git(["fetch", "origin"], capture=False)
 
-    print(f"\n[2] git checkout {TARGET_BRANCH}")
-    run_git(["checkout", TARGET_BRANCH], capture=False)
+    try:
+        print(f"\n[2] git checkout {TARGET_BRANCH}")
+        run_git(["checkout", TARGET_BRANCH], capture=False)
 
-    print(f"\n[3] git pull --ff-only origin {TARGET_BRANCH}")
-    run_git(["pull", "--ff-only", "origin", TARGET_BRANCH], capture=False)
+        print(f"\n[3] git pull --ff-only origin {TARGET_BRANCH}")
+        run_git(["pull", "--ff-only", "origin", TARGET_BRANCH], capture=False)
 
-    print(f"\n[4] git checkout -b {name}")
-    run_git(["checkout", "-b", name], capture=False)
+        print(f"\n[4] git checkout -b {name}")
+        run_git(["checkout", "-b", name], capture=False)
+    finally:
+        _repo_identity.cache_clear()
 
     print(f"\nCreated branch '{name}' from '{TARGET_BRANCH}'.\n")
 
@@ -44,12 +44,7 @@ def _set_led(byte_val: int, bit: int, on: bool, active_low: bool) -> int:
 
     # For active-high: ON => 1, OFF => 0
     # For active-low : ON => 0, OFF => 1
-    if active_low:
-        drive_high = not on
-    else:
-        drive_high = on
-
-    if drive_high:
+    if bool(on) ^ bool(active_low):
         return byte_val | m
     return byte_val & ~m
 
@@ -86,26 +81,25 @@ def main() -> int:
             cur = _set_led(cur, bits.green, on=False, active_low=args.active_low)
             bus.write_byte(args.addr, cur)
 
+            # Every cycle starts and ends with both OFF, so the four bytes
+            # written per cycle are constants; precompute (byte, dwell) pairs.
+            both_off = cur
+            green_on = _set_led(both_off, bits.green, on=True, active_low=args.active_low)
+            red_on = _set_led(both_off, bits.red, on=True, active_low=args.active_low)
+            phases = (
+                (green_on, args.on_sec),    # GREEN on
+                (both_off, args.gap_sec),   # GREEN off
+                (red_on, args.on_sec),      # RED on
+                (both_off, args.rest_sec),  # RED off
+            )
+
+            write_byte = bus.write_byte
+            addr = args.addr
+            sleep = time.sleep
             for _ in range(args.cycles):
-                # GREEN on
-                cur = _set_led(cur, bits.green, on=True, active_low=args.active_low)
-                bus.write_byte(args.addr, cur)
-                time.sleep(args.on_sec)
-
-                # GREEN off
-                cur = _set_led(cur, bits.green, on=False, active_low=args.active_low)
-                bus.write_byte(args.addr, cur)
-                time.sleep(args.gap_sec)
-
-                # RED on
-                cur = _set_led(cur, bits.red, on=True, active_low=args.active_low)
-                bus.write_byte(args.addr, cur)
-                time.sleep(args.on_sec)
-
-                # RED off
-                cur = _set_led(cur, bits.red, on=False, active_low=args.active_low)
-                bus.write_byte(args.addr, cur)
-                time.sleep(args.rest_sec)
+                for byte, dwell in phases:
+                    write_byte(addr, byte)
+                    sleep(dwell)
 
         finally:
             bus.write_byte(args.addr, orig)
@@ -2,23 +2,22 @@
 from __future__ import annotations
 
 import argparse
+import csv
 import re
-import subprocess
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
-
-import matplotlib.pyplot as plt
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 
 # Matches a radon line like:
 #     F 108:0 adc_watch - C (11)
+# Used with fullmatch(); groups() order is kind, line, col, name, grade, cc.
 RADON_LINE_RE = re.compile(
-    r"^\s*(?P<kind>[FCM])\s+"
+    r"\s*(?P<kind>[FCM])\s+"
     r"(?P<line>\d+):(?P<col>\d+)\s+"
     r"(?P<name>.+?)\s+-\s+"
-    r"(?P<grade>[A-F])\s+\((?P<cc>\d+)\)\s*$"
+    r"(?P<grade>[A-F])\s+\((?P<cc>\d+)\)\s*"
 )
 
 
@@ -33,43 +32,66 @@ class Block:
     col: int
 
 
-def _run_radon(root: str) -> str:
+def _file_blocks(path: str) -> List[Block]:
+    """
+    Runs radon's complexity visitor over one file, in-process. A file that
+    cannot be read or parsed is reported like radon does and yields nothing.
+
+    Hazard level: low (read-only).
     """
-    Runs 'radon cc -s -a <root>' and returns stdout.
+    from radon.complexity import cc_rank, cc_visit
+
+    try:
+        blocks = cc_visit(Path(path).read_text(encoding="utf-8"))
+    except (SyntaxError, UnicodeDecodeError) as exc:
+        print(f"{path}\n    ERROR: {exc}", file=sys.stderr)
+        return []
+    return [
+        Block(
+            file=path,
+            kind=b.letter,
+            name=b.fullname,
+            grade=cc_rank(b.complexity),
+            cc=b.complexity,
+            line=b.lineno,
+            col=b.col_offset,
+        )
+        for b in blocks
+    ]
 
-    Hazard level: low (read-only tool).
+
+def _collect(root: str) -> Iterator[Block]:
+    """
+    Same blocks as 'radon cc -s -a <root>' without the subprocess and text
+    round trip. Files come from radon's own walker, so hidden directories
+    are skipped exactly as the CLI skips them.
     """
-    cmd = ["radon", "cc", "-s", "-a", root]
     try:
-        proc = subprocess.run(
-            cmd,
-            check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
+        from radon.cli.tools import iter_filenames
+    except ImportError:
+        raise SystemExit(
+            "radon not found. Activate venv and 'pip install -e .[dev]' "
+            "(or 'pip install radon')."
         )
-    except FileNotFoundError:
-        raise SystemExit("radon not found. Activate venv or 'pip install radon'.")
-    except subprocess.CalledProcessError as e:
-        msg = (e.stderr or "").strip()
-        raise SystemExit(f"radon failed: {msg if msg else e}")
-    return proc.stdout
 
+    for path in sorted(iter_filenames([root])):
+        yield from _file_blocks(path)
 
-def _parse_radon(text: str) -> List[Block]:
-    blocks: List[Block] = []
+
+def _parse_radon(text: str) -> Iterator[Block]:
     cur_file: Optional[str] = None
 
-    for raw in text.splitlines():
-        line = raw.rstrip("\n")
+    fullmatch = RADON_LINE_RE.fullmatch
 
+    # splitlines() already drops the line terminators
+    for line in text.splitlines():
         # File header lines look like: "src/main.py"
         # (No leading whitespace in typical radon output.)
-        if line and not line.startswith(" ") and line.endswith(".py"):
+        if line and line[0] != " " and line.endswith(".py"):
             cur_file = line.strip()
             continue
 
-        m = RADON_LINE_RE.match(line)
+        m = fullmatch(line)
         if not m:
             continue
 
@@ -77,48 +99,68 @@ def _parse_radon(text: str) -> List[Block]:
             # Unexpected, but don't crash.
             cur_file = "<unknown>"
 
-        blocks.append(
-            Block(
-                file=cur_file,
-                kind=m.group("kind"),
-                name=m.group("name").strip(),
-                grade=m.group("grade"),
-                cc=int(m.group("cc")),
-                line=int(m.group("line")),
-                col=int(m.group("col")),
-            )
+        kind, lineno, col, name, grade, cc = m.groups()
+        yield Block(
+            file=cur_file,
+            kind=kind,
+            name=name.strip(),
+            grade=grade,
+            cc=int(cc),
+            line=int(lineno),
+            col=int(col),
         )
 
-    return blocks
 
+@dataclass
+class Summary:
+    counts: Dict[int, int] = field(default_factory=dict)
+    total: int = 0
+    cc_sum: int = 0
+    cc_max: int = 0
+    kept: List[Block] = field(default_factory=list)
 
-def _histogram(values: Iterable[int]) -> Tuple[List[int], List[int]]:
-    """
-    Returns (xs, counts) where xs are unique complexity values in ascending order.
-    """
-    counts = {}
-    for v in values:
-        counts[v] = counts.get(v, 0) + 1
-    xs = sorted(counts.keys())
-    ys = [counts[x] for x in xs]
-    return xs, ys
+    @property
+    def cc_avg(self) -> float:
+        return (self.cc_sum / self.total) if self.total else 0.0
 
+    def histogram(self) -> Tuple[List[int], List[int]]:
+        """
+        Returns (xs, counts) where xs are unique complexity values in ascending order.
+        """
+        xs = sorted(self.counts)
+        return xs, [self.counts[x] for x in xs]
 
-def _integrated_complexity(values: Iterable[int]) -> int:
-    return sum(int(v) for v in values)
 
-
-def _avg(values: List[int]) -> float:
-    return (sum(values) / len(values)) if values else 0.0
-
-
-def _write_csv(blocks: List[Block], path: Path) -> None:
-    lines = ["file,kind,name,grade,cc,line,col"]
+def _consume(blocks: Iterable[Block], want_list: bool) -> Summary:
+    """
+    Single pass over the parsed blocks: histogram, sum, max and count.
+    Blocks are only kept (for CSV output) when want_list is set.
+    """
+    summary = Summary()
+    counts = summary.counts
+    total = cc_sum = cc_max = 0
     for b in blocks:
-        # crude CSV escaping: wrap name in quotes and escape quotes
-        name = '"' + b.name.replace('"', '""') + '"'
-        lines.append(f"{b.file},{b.kind},{name},{b.grade},{b.cc},{b.line},{b.col}")
-    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        cc = b.cc
+        counts[cc] = counts.get(cc, 0) + 1
+        total += 1
+        cc_sum += cc
+        if cc > cc_max:
+            cc_max = cc
+        if want_list:
+            summary.kept.append(b)
+    summary.total = total
+    summary.cc_sum = cc_sum
+    summary.cc_max = cc_max
+    return summary
+
+
+def _write_csv(blocks: Iterable[Block], path: Path) -> None:
+    with path.open("w", encoding="utf-8", newline="", buffering=1 << 16) as f:
+        w = csv.writer(f, lineterminator="\n")
+        w.writerow(["file", "kind", "name", "grade", "cc", "line", "col"])
+        w.writerows(
+            (b.file, b.kind, b.name, b.grade, b.cc, b.line, b.col) for b in blocks
+        )
 
 
 def _plot_histogram(
@@ -132,6 +174,13 @@ def _plot_histogram(
     cc_sum: int,
     cc_max: int,
 ) -> None:
+    # Deferred: matplotlib (and numpy under it) is only paid for when a PNG
+    # is actually requested. Agg skips GUI backend setup.
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
     plt.figure()
     plt.bar(xs, ys)
     plt.xlabel("Cyclomatic complexity (CC)")
@@ -165,7 +214,7 @@ def main() -> None:
     ap.add_argument(
         "--out",
         default="complexity_hist.png",
-        help="Output PNG path (default: complexity_hist.png).",
+        help="Output PNG path, or 'none' to skip the plot (default: complexity_hist.png).",
     )
     ap.add_argument(
         "--title",
@@ -180,54 +229,53 @@ def main() -> None:
     ap.add_argument(
         "--stdin",
         action="store_true",
-        help="Read radon output from stdin instead of running radon.",
+        help="Read 'radon cc -s -a' output from stdin instead of analyzing --root.",
     )
 
     args = ap.parse_args()
 
     if args.stdin:
-        text = sys.stdin.read()
+        blocks = _parse_radon(sys.stdin.read())
     else:
-        text = _run_radon(args.root)
+        blocks = _collect(args.root)
 
-    blocks = _parse_radon(text)
-    if not blocks:
+    summary = _consume(blocks, want_list=bool(args.csv))
+    if not summary.total:
         raise SystemExit(
             "No blocks parsed. Are you sure this is radon 'cc -s -a' output?"
         )
 
-    values = [b.cc for b in blocks]
-    xs, ys = _histogram(values)
-
-    cc_sum = _integrated_complexity(values)
-    cc_avg = _avg(values)
-    cc_max = max(values) if values else 0
+    xs, ys = summary.histogram()
+    cc_sum = summary.cc_sum
+    cc_avg = summary.cc_avg
+    cc_max = summary.cc_max
 
     # Console summary (useful even if you never open the PNG)
-    print(f"blocks: {len(values)}")
+    print(f"blocks: {summary.total}")
     print(f"avg_cc: {cc_avg:.3f}")
     print(f"integrated_cc: {cc_sum}")
     print(f"max_cc: {cc_max}")
     print(f"hist: {dict(zip(xs, ys))}")
 
-    title = args.title or "Cyclomatic complexity histogram"
-    out_path = Path(args.out)
-
-    _plot_histogram(
-        xs,
-        ys,
-        title=title,
-        out_path=out_path,
-        blocks_total=len(values),
-        cc_avg=cc_avg,
-        cc_sum=cc_sum,
-        cc_max=cc_max,
-    )
-    print(f"Wrote: {out_path}")
+    if args.out and args.out.lower() != "none":
+        title = args.title or "Cyclomatic complexity histogram"
+        out_path = Path(args.out)
+
+        _plot_histogram(
+            xs,
+            ys,
+            title=title,
+            out_path=out_path,
+            blocks_total=summary.total,
+            cc_avg=cc_avg,
+            cc_sum=cc_sum,
+            cc_max=cc_max,
+        )
+        print(f"Wrote: {out_path}")
 
     if args.csv:
         csv_path = Path(args.csv)
-        _write_csv(blocks, csv_path)
+        _write_csv(summary.kept, csv_path)
         print(f"Wrote: {csv_path}")
 
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Iterable, List
+from typing import FrozenSet, Iterable, List, Optional, Tuple
 
 log = logging.getLogger("event_bus")
 
@@ -12,19 +12,28 @@ class EventBus:
 
     IMPORTANT: asyncio.Queue is a work queue (one consumer). We need broadcast:
     every subscriber should see every event.
+
+    A subscriber may pass types=... to receive only those event types; the
+    rest are never queued for it.
     """
 
     def __init__(self) -> None:
-        self._subs: List[asyncio.Queue] = []
+        # (queue, accepted event types or None for everything)
+        self._subs: List[Tuple[asyncio.Queue, Optional[FrozenSet[str]]]] = []
 
-    def subscribe(self, maxsize: int = 0) -> asyncio.Queue:
+    def subscribe(
+        self, maxsize: int = 0, types: Optional[Iterable[str]] = None
+    ) -> asyncio.Queue:
         q: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
-        self._subs.append(q)
+        self._subs.append((q, frozenset(types) if types is not None else None))
         return q
 
     async def publish(self, event) -> None:
         # Fan-out. If a subscriber is too slow and has maxsize set, drop.
-        for q in list(self._subs):
+        ev_type = getattr(event, "type", None)
+        for q, types in list(self._subs):
+            if types is not None and ev_type not in types:
+                continue
             try:
                 q.put_nowait(event)
             except asyncio.QueueFull:
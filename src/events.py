@@ -1,15 +1,69 @@
 from dataclasses import dataclass
-from typing import Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+import sys
 import time
 
+# Event types with a fixed spelling. Interned so that subscribers comparing
+# against these constants (or using them as dict keys) hit the identity
+# fast path; Event.now() interns every type/src it is given as well.
+EVT_MACHINE_ON = sys.intern("machine.on")
+EVT_MACHINE_OFF = sys.intern("machine.off")
+# Per-tool events published by adc_watch ("<tool>.on"/"<tool>.off")
+EVT_SAW_ON = sys.intern("saw.on")
+EVT_SAW_OFF = sys.intern("saw.off")
+EVT_LATHE_ON = sys.intern("lathe.on")
+EVT_LATHE_OFF = sys.intern("lathe.off")
+EVT_SYSTEM_ANY_ACTIVE = sys.intern("system.any_active")
+EVT_AQM_METRICS = sys.intern("aqm.metrics")
+EVT_AQM_GOOD = sys.intern("aqm.good")
+EVT_AQM_BAD = sys.intern("aqm.bad")
 
-@dataclass
+# Shared, read-only payload for events published without keyword data.
+_NO_DATA: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(slots=True, frozen=True)
 class Event:
     type: str      # e.g. "machine.on", "machine.off", "system.any_active"
     src: str       # e.g. "adc.tablesaw"
-    ts: float
-    data: Dict
+    ts_ns: int     # time.monotonic_ns() at creation
+    data: Mapping[str, Any]
+
+    @property
+    def ts(self) -> float:
+        """Creation time in seconds (time.monotonic() scale)."""
+        return self.ts_ns * 1e-9
 
     @staticmethod
-    def now(type_: str, src: str, **data):
-        return Event(type=type_, src=src, ts=time.monotonic(), data=data)
+    def now(type_: str, src: str, ts_ns: Optional[int] = None, **data):
+        # Hot producers may pass one ts_ns for a whole batch of events.
+        if ts_ns is None:
+            ts_ns = time.monotonic_ns()
+        return Event(
+            type=sys.intern(type_),
+            src=sys.intern(src),
+            ts_ns=ts_ns,
+            data=data or _NO_DATA,
+        )
+
+    @staticmethod
+    def now_d(
+        type_: str,
+        src: str,
+        fields: Dict[str, Any],
+        ts_ns: Optional[int] = None,
+    ):
+        """Like now(), but keeps `fields` by reference as the event data.
+
+        The caller hands over ownership: the dict must not be mutated after
+        publishing, since every subscriber sees the same object.
+        """
+        if ts_ns is None:
+            ts_ns = time.monotonic_ns()
+        return Event(
+            type=sys.intern(type_),
+            src=sys.intern(src),
+            ts_ns=ts_ns,
+            data=fields or _NO_DATA,
+        )
@@ -1,35 +1,99 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+import functools
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, ClassVar, Optional, Tuple
 
 
+try:
+    import gpiod as _gpiod
+except Exception:  # pragma: no cover
+    _gpiod = None
+
 try:
     import RPi.GPIO as _GPIO
 except Exception:  # pragma: no cover
     _GPIO = None
 
+log = logging.getLogger(__name__)
+
+GPIO_CHIP = "gpiochip0"
+GPIO_CONSUMER = "DustCollector"
+
+
+@functools.lru_cache(maxsize=1)
+def _use_gpiod() -> bool:
+    """
+    Backend selection: RPi.GPIO by default. DUSTCOLLECTOR_GPIO=gpiod opts in
+    to the libgpiod character device. Only the libgpiod v1 Python API
+    (Chip.get_line / LINE_REQ_DIR_OUT) is spoken; anything else stays on
+    RPi.GPIO.
+    """
+    backend = os.environ.get("DUSTCOLLECTOR_GPIO", "").strip().lower()
+    if backend != "gpiod":
+        return False
+    if _gpiod is None or not hasattr(_gpiod, "LINE_REQ_DIR_OUT"):
+        log.warning(
+            "DUSTCOLLECTOR_GPIO=gpiod but libgpiod v1 bindings are not available; "
+            "using RPi.GPIO"
+        )
+        return False
+    return True
+
 
 @dataclass
 class GPIOOut:
     pin: int
     active_high: bool = True
     _initialized: bool = False
+    _line: Any = field(default=None, repr=False)
+    _inversion: int = field(default=0, repr=False)  # 1 when active-low
+    # Bound at _init so write() needs no backend attribute lookups:
+    # _set(level) drives the pin, _levels maps 0/1 to the backend's values.
+    _set: Optional[Callable[[Any], Any]] = field(default=None, repr=False)
+    _levels: Tuple[Any, Any] = field(default=(0, 1), repr=False)
+
+    # One chip handle shared by every gpiod-backed output
+    _chip: ClassVar[Any] = None
 
     def _init(self) -> None:
         if self._initialized:
             return
+        self._inversion = 0 if self.active_high else 1
+        if _use_gpiod():
+            try:
+                self._init_gpiod()
+            except Exception:
+                log.exception("gpiod init failed for pin %d; falling back to RPi.GPIO", self.pin)
+            else:
+                self._initialized = True
+                return
         if _GPIO is None:
             raise RuntimeError("RPi.GPIO not available on this platform")
         _GPIO.setmode(_GPIO.BCM)
         _GPIO.setup(self.pin, _GPIO.OUT)
+        self._set = functools.partial(_GPIO.output, self.pin)
+        self._levels = (_GPIO.LOW, _GPIO.HIGH)
         self._initialized = True
 
+    def _init_gpiod(self) -> None:
+        assert _gpiod is not None
+        if GPIOOut._chip is None:
+            GPIOOut._chip = _gpiod.Chip(GPIO_CHIP)
+        line = GPIOOut._chip.get_line(self.pin)
+        line.request(consumer=GPIO_CONSUMER, type=_gpiod.LINE_REQ_DIR_OUT)
+        self._line = line
+        # Held line handle: one ioctl per write
+        self._set = line.set_value
+        self._levels = (0, 1)
+
     def write(self, on: bool) -> None:
-        self._init()
-        assert _GPIO is not None
-        level = _GPIO.HIGH if (on if self.active_high else not on) else _GPIO.LOW
-        _GPIO.output(self.pin, level)
+        if not self._initialized:
+            self._init()
+        assert self._set is not None
+        self._set(self._levels[(1 if on else 0) ^ self._inversion])
 
     def on(self) -> None:
         self.write(True)
@@ -2,11 +2,11 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Literal, Optional
+from typing import Iterable, Literal, Optional, Tuple
 
 from .gpio import GPIOOut
 from .i2c_bus import I2CBus
-from .pcf8574 import PCF8574
+from .pcf8574 import BIT, PCF8574
 from .uart import open_serial
 
 log = logging.getLogger("hardware")
@@ -23,10 +23,13 @@ def _normalize_mode(s: Optional[str]) -> Optional[HardwareMode]:
     return None
 
 
+def _hw_cfg(cfg) -> dict:
+    """The hardware: section of the config ({} when absent)."""
+    return (getattr(cfg, "raw", None) or {}).get("hardware") or {}
+
+
 def _cfg_hw_mode(cfg) -> HardwareMode:
-    raw = getattr(cfg, "raw", {}) or {}
-    hw = raw.get("hardware", {}) or {}
-    mode = _normalize_mode(hw.get("mode"))
+    mode = _normalize_mode(_hw_cfg(cfg).get("mode"))
     return mode or "mock"
 
 
@@ -35,10 +38,8 @@ def _env_hw_mode() -> Optional[HardwareMode]:
 
 
 def _cfg_outputs_enabled(cfg) -> bool:
-    raw = getattr(cfg, "raw", {}) or {}
-    hw = raw.get("hardware", {}) or {}
     # Default: False (safety)
-    return bool(hw.get("outputs_enabled", False))
+    return bool(_hw_cfg(cfg).get("outputs_enabled", False))
 
 
 def get_hardware(cfg):
@@ -117,8 +118,11 @@ class Hardware:
     def pcf_write_init(self) -> None:
         if self._inhibited("pcf_write_init()"):
             return
-        self.pcf_led.write_byte(0xFF)
-        self.pcf_act.write_byte(0xFF)
+        # Both expanders sit on the same bus: one combined transaction
+        led, act = self.pcf_led, self.pcf_act
+        self.i2c.write_many((led.addr, b"\xff"), (act.addr, b"\xff"))
+        led.state = 0xFF
+        act.state = 0xFF
 
     def gpio_set_ssr(self, gpio, on: bool) -> None:
         if self._inhibited(
@@ -139,20 +143,32 @@ class Hardware:
         red_on: bool,
         green_on: bool,
     ) -> None:
+        self.led_set_many(((red_bit, red_on), (green_bit, green_on)))
+
+    def led_set_many(self, updates: Iterable[Tuple[int, bool]]) -> None:
+        """Apply any number of (bit, on) LED changes with at most one write."""
+        # LEDs are active-low: ON clears the bit, OFF sets it.
+        # Later updates to the same bit win, as with sequential writes.
+        set_mask = clear_mask = 0
+        for bit, on in updates:
+            m = BIT[bit]
+            if on:
+                clear_mask |= m
+                set_mask &= ~m
+            else:
+                set_mask |= m
+                clear_mask &= ~m
+        self._pcf_led_update(set_mask=set_mask, clear_mask=clear_mask)
+
+    def _pcf_led_update(self, *, set_mask: int = 0, clear_mask: int = 0) -> None:
         if self._inhibited(
-            f"led_set_pair(r={red_bit}, g={green_bit}, "
-            f"red_on={red_on}, green_on={green_on})"
+            f"_pcf_led_update(set=0x{set_mask:02X}, clear=0x{clear_mask:02X})"
         ):
             return
-
-        state = self.pcf_led.state
-
-        def setbit(st: int, b: int, on_: bool) -> int:
-            return (st & ~(1 << b)) if on_ else (st | (1 << b))
-
-        state = setbit(state, red_bit, red_on)
-        state = setbit(state, green_bit, green_on)
-        self.pcf_led.write_byte(state)
+        pcf = self.pcf_led
+        new_state = (pcf.state | set_mask) & ~clear_mask
+        if new_state != pcf.state:
+            pcf.write_byte(new_state)
 
     # ---- Relay-bank helpers (atomic masked updates) ----
 
@@ -162,13 +178,14 @@ class Hardware:
         ):
             return
         new_state = (self.pcf_act.state | (set_mask & 0xFF)) & ~(clear_mask & 0xFF)
-        self.pcf_act.write_byte(new_state)
+        if new_state != self.pcf_act.state:
+            self.pcf_act.write_byte(new_state)
 
     def relays_stop_gate(self, fwd_bit: int, rev_bit: int) -> None:
-        self._pcf_act_update(set_mask=(1 << fwd_bit) | (1 << rev_bit))
+        self._pcf_act_update(set_mask=BIT[fwd_bit] | BIT[rev_bit])
 
     def relays_drive(self, bit: int, active_low_on: bool) -> None:
         if active_low_on:
-            self._pcf_act_update(clear_mask=(1 << bit))
+            self._pcf_act_update(clear_mask=BIT[bit])
         else:
-            self._pcf_act_update(set_mask=(1 << bit))
+            self._pcf_act_update(set_mask=BIT[bit])
@@ -1,7 +1,17 @@
 from __future__ import annotations
+from typing import Tuple
+
 import smbus2
 
 
 class I2CBus:
     def __init__(self, bus_id: int = 1) -> None:
         self.bus = smbus2.SMBus(bus_id)
+
+    def write_many(self, *writes: Tuple[int, bytes]) -> None:
+        """
+        Issue several (addr, data) writes as one combined I2C transaction
+        (repeated start between messages, a single stop at the end).
+        """
+        if writes:
+            self.bus.i2c_rdwr(*(smbus2.i2c_msg.write(a, d) for a, d in writes))
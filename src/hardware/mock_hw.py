@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import logging
+from typing import Iterable, Tuple
+
+from .pcf8574 import BIT
 
 log = logging.getLogger("mock_hw")
 
@@ -23,8 +26,10 @@ class MockPCF8574:
         self.addr = addr
         self.state = 0xFF
 
-    def write_byte(self, value: int) -> None:
+    def write_byte(self, value: int, *, force: bool = False) -> None:
         value &= 0xFF
+        if value == self.state and not force:
+            return
         self.state = value
         log.info("PCF8574 0x%02X <= 0x%02X", self.addr, value)
 
@@ -69,8 +74,8 @@ class MockHardware:
         self.gpio24 = MockGPIOOut(24)
 
     def pcf_write_init(self) -> None:
-        self.pcf_led.write_byte(0xFF)
-        self.pcf_act.write_byte(0xFF)
+        self.pcf_led.write_byte(0xFF, force=True)
+        self.pcf_act.write_byte(0xFF, force=True)
 
     def gpio_set_ssr(self, gpio, on: bool) -> None:
         gpio.write(on)
@@ -86,25 +91,40 @@ class MockHardware:
         red_on: bool,
         green_on: bool,
     ) -> None:
-        state = self.pcf_led.state
-
-        def setbit(st: int, b: int, on_: bool) -> int:
-            return (st & ~(1 << b)) if on_ else (st | (1 << b))
-
-        state = setbit(state, red_bit, red_on)
-        state = setbit(state, green_bit, green_on)
-        self.pcf_led.write_byte(state)
+        self.led_set_many(((red_bit, red_on), (green_bit, green_on)))
+
+    def led_set_many(self, updates: Iterable[Tuple[int, bool]]) -> None:
+        """Apply any number of (bit, on) LED changes with at most one write."""
+        # LEDs are active-low: ON clears the bit, OFF sets it.
+        # Later updates to the same bit win, as with sequential writes.
+        set_mask = clear_mask = 0
+        for bit, on in updates:
+            m = BIT[bit]
+            if on:
+                clear_mask |= m
+                set_mask &= ~m
+            else:
+                set_mask |= m
+                clear_mask &= ~m
+        self._pcf_led_update(set_mask=set_mask, clear_mask=clear_mask)
+
+    def _pcf_led_update(self, *, set_mask: int = 0, clear_mask: int = 0) -> None:
+        pcf = self.pcf_led
+        new_state = (pcf.state | set_mask) & ~clear_mask
+        if new_state != pcf.state:
+            pcf.write_byte(new_state)
 
     # ---- Relay-bank helpers (atomic masked updates) ----
     def _pcf_act_update(self, *, set_mask: int = 0, clear_mask: int = 0) -> None:
         new_state = (self.pcf_act.state | (set_mask & 0xFF)) & ~(clear_mask & 0xFF)
-        self.pcf_act.write_byte(new_state)
+        if new_state != self.pcf_act.state:
+            self.pcf_act.write_byte(new_state)
 
     def relays_stop_gate(self, fwd_bit: int, rev_bit: int) -> None:
-        self._pcf_act_update(set_mask=(1 << fwd_bit) | (1 << rev_bit))
+        self._pcf_act_update(set_mask=BIT[fwd_bit] | BIT[rev_bit])
 
     def relays_drive(self, bit: int, active_low_on: bool) -> None:
         if active_low_on:
-            self._pcf_act_update(clear_mask=(1 << bit))
+            self._pcf_act_update(clear_mask=BIT[bit])
         else:
-            self._pcf_act_update(set_mask=(1 << bit))
+            self._pcf_act_update(set_mask=BIT[bit])
@@ -1,6 +1,10 @@
 from __future__ import annotations
 import time
 
+# Per-bit masks for the 8 expander outputs, so callers index a tuple
+# instead of shifting on every update.
+BIT = tuple(1 << b for b in range(8))
+
 
 class PCF8574:
     def __init__(self, i2c, addr: int):
@@ -8,8 +12,13 @@ class PCF8574:
         self.addr = addr
         self.state = 0xFF  # high (idle) on power-up
 
-    def write_byte(self, value: int) -> None:
+    def write_byte(self, value: int, *, force: bool = False) -> None:
+        # Skip the I2C transaction when the shadow state already matches;
+        # force=True writes regardless (e.g. init, where the chip state is
+        # not known yet).
         value &= 0xFF
+        if value == self.state and not force:
+            return
         self.state = value
         self.i2c.bus.write_byte(self.addr, value)
 
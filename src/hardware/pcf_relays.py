@@ -5,6 +5,8 @@ from dataclasses import dataclass
 
 from smbus2 import SMBus
 
+from .pcf8574 import BIT
+
 log = logging.getLogger(__name__)
 
 
@@ -30,7 +32,9 @@ class PcfRelays:
 
     Notes:
     - This is a *byte* device: writes replace all 8 outputs.
-    - We do read-modify-write and touch only the specified bits.
+    - Updates modify a cached copy of the last written byte and touch only
+      the specified bits; outputs are not re-read over I2C on each change.
+      A failed write leaves the chip state unknown, so it is re-read then.
     - active_low is defined at the PCF output pin (see PcfRelaysConfig).
     - We capture the original byte on init so we can restore it (optional).
     """
@@ -61,48 +65,59 @@ class PcfRelays:
         except Exception:
             pass
 
+    def resync(self) -> None:
+        """Re-read the expander into the cached state (after I2C errors)."""
+        try:
+            self._cur = self._read_byte()
+        except Exception:
+            log.exception("PCF relays: resync read failed; cached state kept")
+
     def set_relay(self, bit: int, on: bool) -> None:
-        base = self._read_byte()
-        v = self._set_bit(base, bit, on)
-        self._write_byte(v)
-        self._cur = v
+        if on:
+            self.set_mask(mask_set=BIT[bit])
+        else:
+            self.set_mask(mask_clear=BIT[bit])
 
     def stop_pair(self, bit_a: int, bit_b: int) -> None:
-        base = self._read_byte()
-        v = base
-        v = self._set_bit(v, bit_a, False)
-        v = self._set_bit(v, bit_b, False)
-        self._write_byte(v)
-        self._cur = v
+        self.set_mask(mask_clear=BIT[bit_a] | BIT[bit_b])
+
+    def set_mask(self, mask_clear: int = 0, mask_set: int = 0) -> None:
+        """
+        Turn OFF the relays in mask_clear and ON those in mask_set with a
+        single port write. Masks are relay bits; polarity is applied here.
+        A bit in both masks ends up ON.
+        """
+        cur = self._cur
+        if self._cfg.active_low:
+            # ON drives LOW, OFF drives HIGH
+            v = (cur | mask_clear) & ~mask_set & 0xFF
+        else:
+            v = ((cur & ~mask_clear) | mask_set) & 0xFF
+        if v == cur:
+            return
+        self._write_checked(v)
 
     def all_off(self) -> None:
         # For PCF-active-low: OFF = HIGH => 0xFF
         # For PCF-active-high: OFF = LOW  => 0x00  (matches your openclose.py)
         off = 0xFF if self._cfg.active_low else 0x00
-        self._write_byte(off)
-        self._cur = off
+        self._write_checked(off)
 
     # -------- internals --------
 
-    def _mask(self, bit: int) -> int:
-        return 1 << bit
-
-    def _set_bit(self, byte_val: int, bit: int, on: bool) -> int:
-        # If PCF is active_low:
-        #   on=True  -> drive LOW  -> bit=0
-        #   on=False -> drive HIGH -> bit=1
-        # If PCF is active_high:
-        #   on=True  -> drive HIGH -> bit=1
-        #   on=False -> drive LOW  -> bit=0
-        drive_high = (not on) if self._cfg.active_low else on
-        return (
-            (byte_val | self._mask(bit))
-            if drive_high
-            else (byte_val & ~self._mask(bit))
-        )
-
     def _read_byte(self) -> int:
         return int(self._bus.read_byte(self._cfg.addr))
 
+    def _write_checked(self, value: int) -> None:
+        """Write and cache `value`; on an I2C error resync, then re-raise."""
+        try:
+            self._write_byte(value)
+        except OSError:
+            # The byte may or may not have latched: start the next update
+            # from what the expander actually holds.
+            self.resync()
+            raise
+        self._cur = value
+
     def _write_byte(self, value: int) -> None:
         self._bus.write_byte(self._cfg.addr, value & 0xFF)
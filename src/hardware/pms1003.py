@@ -2,29 +2,36 @@ from __future__ import annotations
 import asyncio
 import logging
 import random
+import struct
 import time
 
-from ..events import Event
+from ..events import EVT_AQM_BAD, EVT_AQM_GOOD, EVT_AQM_METRICS, Event
 from ..event_bus import EventBus
 
 log = logging.getLogger("pms1003")
 
 START1 = 0x42
 START2 = 0x4D
+FRAME_HEADER = bytes((START1, START2))
+FRAME_LEN = 32
+MAX_BUF = 4096
+_READ_CHUNK = 64
+_COMPACT_AT = MAX_BUF // 2
 
+_PM_ATM = struct.Struct(">HHH")
 
-def _checksum_ok(frame: bytes) -> bool:
-    s = sum(frame[0:-2]) & 0xFFFF
-    cs = (frame[-2] << 8) | frame[-1]
-    return s == cs
 
+def _checksum_ok(frame: bytes | memoryview) -> bool:
+    # memoryview: sum the 30 data bytes without copying them into a slice
+    s = sum(memoryview(frame)[:-2]) & 0xFFFF
+    return s == int.from_bytes(frame[-2:], "big")
 
-def _parse(frame: bytes):
+
+def _parse(frame: bytes | memoryview):
     if len(frame) < 32:
         return None
-    pm2_5 = (frame[12] << 8) | frame[13]
-    pm1_0 = (frame[10] << 8) | frame[11]
-    pm10 = (frame[14] << 8) | frame[15]
+    # Atmospheric PM1.0 / PM2.5 / PM10, big-endian u16 at bytes 10..15
+    pm1_0, pm2_5, pm10 = _PM_ATM.unpack_from(frame, 10)
     return {"pm1_0": pm1_0, "pm2_5": pm2_5, "pm10": pm10}
 
 
@@ -44,15 +51,14 @@ async def _mock_aqm(bus: EventBus, cfg):
         pm25 = base + (bump if in_bump else 0) + int(random.gauss(0, 2))
         pm25 = max(0, pm25)
         metrics = {"pm1_0": max(0, pm25 - 3), "pm2_5": pm25, "pm10": pm25 + 6}
-        await bus.publish(Event.now("aqm.metrics", "aqm.mock", **metrics))
+        await bus.publish(Event.now_d(EVT_AQM_METRICS, "aqm.mock", metrics))
         bad = pm25 >= bad_th
         severe = pm25 >= sev_th
         await bus.publish(
-            Event.now(
-                "aqm.bad" if bad else "aqm.good",
+            Event.now_d(
+                EVT_AQM_BAD if bad else EVT_AQM_GOOD,
                 "aqm.mock",
-                pm2_5=pm25,
-                severe=severe,
+                {"pm2_5": pm25, "severe": severe},
             )
         )
         await asyncio.sleep(1.0)
@@ -64,35 +70,59 @@ async def aqm_reader(bus: EventBus, cfg, hw):
         return
 
     ser = hw.ser
-    buf = bytearray()
+    # Fixed ring: bytes live in buf[head:tail]. Frames are consumed by
+    # advancing head; the unread tail is moved to the front only once head
+    # passes _COMPACT_AT, so nothing is shifted per frame.
+    buf = bytearray(MAX_BUF)
+    view = memoryview(buf)
+    head = tail = 0
     log.info("PMS1003 reader running")
     while True:
         await asyncio.sleep(0)
-        data = ser.read(64)
-        if not data:
+        n = ser.readinto(view[tail:tail + _READ_CHUNK])
+        if not n:
             await asyncio.sleep(0.05)
             continue
-        buf.extend(data)
-        while len(buf) >= 32:
-            if buf[0] != START1 or (len(buf) > 1 and buf[1] != START2):
-                buf.pop(0)
-                continue
-            frame = bytes(buf[:32])
-            del buf[:32]
-            if not _checksum_ok(frame):
-                continue
-            metrics = _parse(frame)
+        tail += n
+
+        # Jump between frame headers with bytearray.find; frames are parsed
+        # from zero-copy views.
+        while True:
+            idx = buf.find(FRAME_HEADER, head, tail)
+            if idx < 0:
+                # Keep a trailing unread START1: its START2 may be in the
+                # next read.
+                head = tail - 1 if tail > head and buf[tail - 1] == START1 else tail
+                break
+            if tail - idx < FRAME_LEN:
+                head = idx
+                break
+            with view[idx:idx + FRAME_LEN] as frame:
+                if not _checksum_ok(frame):
+                    head = idx + 1
+                    continue
+                metrics = _parse(frame)
+            head = idx + FRAME_LEN
             if not metrics:
                 continue
             pm25 = metrics["pm2_5"]
-            await bus.publish(Event.now("aqm.metrics", "aqm.pms1003", **metrics))
+            # _parse builds a fresh dict per frame; hand it over as-is
+            await bus.publish(Event.now_d(EVT_AQM_METRICS, "aqm.pms1003", metrics))
             bad = pm25 >= cfg.raw["aqm"]["bad_threshold"]
             severe = pm25 >= cfg.raw["aqm"]["severe_threshold"]
             await bus.publish(
-                Event.now(
-                    "aqm.bad" if bad else "aqm.good",
+                Event.now_d(
+                    EVT_AQM_BAD if bad else EVT_AQM_GOOD,
                     "aqm.pms1003",
-                    pm2_5=pm25,
-                    severe=severe,
+                    {"pm2_5": pm25, "severe": severe},
                 )
             )
+
+        if head == tail:
+            head = tail = 0
+        elif head > _COMPACT_AT:
+            # At most one partial frame remains; equal-length slice
+            # assignment keeps the buffer (and its exported view) in place.
+            size = tail - head
+            buf[:size] = buf[head:tail]
+            head, tail = 0, size
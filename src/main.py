@@ -8,6 +8,11 @@ from typing import Optional
 
 from smbus2 import SMBus
 
+try:
+    import uvloop as _uvloop
+except Exception:  # pragma: no cover
+    _uvloop = None
+
 from .config_loader import AppConfig
 from .event_bus import EventBus
 from .hardware.pcf_relays import PcfRelays, PcfRelaysConfig
@@ -28,9 +33,18 @@ def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
 
 async def _event_logger(bus: EventBus) -> None:
     q = bus.subscribe(maxsize=100)
+    get = q.get
+    get_nowait = q.get_nowait
     try:
         while True:
-            await q.get()
+            # One wakeup per burst: take the first event, then drain
+            # whatever else is already queued without yielding.
+            await get()
+            while True:
+                try:
+                    get_nowait()
+                except asyncio.QueueEmpty:
+                    break
     except asyncio.CancelledError:
         log.info("Event logger cancelled")
         raise
@@ -128,6 +142,10 @@ async def _run_app(config_path: str) -> None:
 def main(argv: Optional[list[str]] = None) -> int:
     args = _parse_args(argv)
 
+    # libuv-based loop when installed: cheaper wakeups/timers on the Pi.
+    if _uvloop is not None:
+        asyncio.set_event_loop_policy(_uvloop.EventLoopPolicy())
+
     try:
         asyncio.run(_run_app(args.config))
         return 0
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from dataclasses import dataclass
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Sequence
 
 from ..event_bus import EventBus
 from ..events import Event
@@ -29,58 +32,82 @@ class AdcWatchConfig:
     consecutive_required: int = 3
 
 
+# Channel number -> ads1x15.Pin attribute name
+_PIN_ATTRS = ("A0", "A1", "A2", "A3")
+
+
 def _pin_for_channel(ads1x15_mod, ch: int):
-    pin_map = {
-        0: ads1x15_mod.Pin.A0,
-        1: ads1x15_mod.Pin.A1,
-        2: ads1x15_mod.Pin.A2,
-        3: ads1x15_mod.Pin.A3,
-    }
-    if ch not in pin_map:
+    if not 0 <= ch < len(_PIN_ATTRS):
         raise ValueError(f"channel must be 0..3 (got {ch})")
-    return pin_map[ch]
+    return getattr(ads1x15_mod.Pin, _PIN_ATTRS[ch])
+
+
+@dataclass
+class _Channel:
+    """One ADC input and its hysteresis state."""
+
+    analog_in: Any
+    tool: str
+    src: str
+    on_threshold: float
+    off_threshold: float
+    is_on: bool = False
+    above_on: int = 0
+    below_off: int = 0
+    # Event types are constant per tool; built once, not per transition.
+    on_evt: str = field(init=False)
+    off_evt: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.on_evt = sys.intern(f"{self.tool}.on")
+        self.off_evt = sys.intern(f"{self.tool}.off")
 
 
-async def _watch_one(
+async def _watch_channels(
     *,
     bus: EventBus,
     period: float,
-    analog_in,
-    tool: str,
-    src: str,
-    on_threshold: float,
-    off_threshold: float,
+    channels: Sequence[_Channel],
     consecutive_required: int,
 ) -> None:
-    is_on = False
-    above_on = 0
-    below_off = 0
-
+    """
+    Single polling loop for all channels: each period reads every channel
+    back-to-back on the shared ADS1115, then runs each hysteresis machine.
+    """
+    next_t = time.monotonic()
     while True:
-        v = float(analog_in.voltage)
-
-        if not is_on:
-            if v >= on_threshold:
-                above_on += 1
-                if above_on >= consecutive_required:
-                    is_on = True
-                    above_on = 0
-                    below_off = 0
-                    await bus.publish(Event.now(f"{tool}.on", src, v=v))
+        volts = [float(ch.analog_in.voltage) for ch in channels]
+
+        for ch, v in zip(channels, volts):
+            if not ch.is_on:
+                if v >= ch.on_threshold:
+                    ch.above_on += 1
+                    if ch.above_on >= consecutive_required:
+                        ch.is_on = True
+                        ch.above_on = 0
+                        ch.below_off = 0
+                        await bus.publish(Event.now(ch.on_evt, ch.src, v=v))
+                else:
+                    ch.above_on = 0
             else:
-                above_on = 0
-        else:
-            if v <= off_threshold:
-                below_off += 1
-                if below_off >= consecutive_required:
-                    is_on = False
-                    above_on = 0
-                    below_off = 0
-                    await bus.publish(Event.now(f"{tool}.off", src, v=v))
-            else:
-                below_off = 0
-
-        await asyncio.sleep(period)
+                if v <= ch.off_threshold:
+                    ch.below_off += 1
+                    if ch.below_off >= consecutive_required:
+                        ch.is_on = False
+                        ch.above_on = 0
+                        ch.below_off = 0
+                        await bus.publish(Event.now(ch.off_evt, ch.src, v=v))
+                else:
+                    ch.below_off = 0
+
+        # Sleep to an absolute deadline so read/publish time does not
+        # accumulate as drift; if we fell a whole period behind, resync.
+        next_t += period
+        delay = next_t - time.monotonic()
+        if delay < 0:
+            next_t -= delay
+            delay = 0
+        await asyncio.sleep(delay)
 
 
 async def run_adc_watch(cfg: AdcWatchConfig, bus: EventBus) -> None:
@@ -135,33 +162,27 @@ async def run_adc_watch(cfg: AdcWatchConfig, bus: EventBus) -> None:
     lathe = AnalogIn(ads, lathe_pin)
 
     try:
-        async with asyncio.TaskGroup() as tg:
-            tg.create_task(
-                _watch_one(
-                    bus=bus,
-                    period=period,
+        await _watch_channels(
+            bus=bus,
+            period=period,
+            channels=(
+                _Channel(
                     analog_in=saw,
                     tool="saw",
                     src="adc.a0",
                     on_threshold=cfg.saw_on_threshold,
                     off_threshold=cfg.saw_off_threshold,
-                    consecutive_required=cfg.consecutive_required,
                 ),
-                name="adc_watch_saw",
-            )
-            tg.create_task(
-                _watch_one(
-                    bus=bus,
-                    period=period,
+                _Channel(
                     analog_in=lathe,
                     tool="lathe",
                     src="adc.a1",
                     on_threshold=cfg.lathe_on_threshold,
                     off_threshold=cfg.lathe_off_threshold,
-                    consecutive_required=cfg.consecutive_required,
                 ),
-                name="adc_watch_lathe",
-            )
+            ),
+            consecutive_required=cfg.consecutive_required,
+        )
     except asyncio.CancelledError:
         log.info("ADC watch cancelled")
         raise
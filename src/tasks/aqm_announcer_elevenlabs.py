@@ -175,11 +175,9 @@ class _Announcer:
         """
         Handle AQM events and play announcements.
         
-        This is the same interface as the original announcer.
+        This is the same interface as the original announcer. Callers only
+        pass aqm.bad / aqm.good (run_aqm_announcer subscribes to just those).
         """
-        if ev_type not in ("aqm.bad", "aqm.good"):
-            return
-
         new_state = "bad" if ev_type == "aqm.bad" else "good"
         
         if self._state is None:
@@ -273,8 +271,8 @@ async def run_aqm_announcer(bus: Any, cfg: Any) -> None:
     # Create announcer
     announcer = _Announcer(audio_dir=str(audio_path), player=player)
     
-    # Subscribe to events
-    q = bus.subscribe(maxsize=200)
+    # Subscribe to AQM transitions only; aqm.metrics never reaches this queue
+    q = bus.subscribe(maxsize=16, types=("aqm.bad", "aqm.good"))
     
     # Track timing for rate limiting
     import time
@@ -287,18 +285,16 @@ async def run_aqm_announcer(bus: Any, cfg: Any) -> None:
         # Check rate limiting
         now = time.monotonic()
         if now - last_announce_ts < min_seconds_between:
-            if ev_type in ("aqm.bad", "aqm.good"):
-                log.info(f"AQM announce suppressed (rate limit): {ev_type}")
+            log.info(f"AQM announce suppressed (rate limit): {ev_type}")
             ######continue
             
         # Process event
         await announcer.on_event(ev_type)
         
         # Update timestamp if announcement was made
-        if ev_type in ("aqm.bad", "aqm.good"):
-            new_state = "bad" if ev_type == "aqm.bad" else "good"
-            if announcer._state == new_state:
-                last_announce_ts = now
+        new_state = "bad" if ev_type == "aqm.bad" else "good"
+        if announcer._state == new_state:
+            last_announce_ts = now
 
 
 # =============================================================================
@@ -1,40 +1,65 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
+import os
 import shutil
-import subprocess
+import tempfile
 import time
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Optional
 
 from ..event_bus import EventBus
+from ..events import EVT_AQM_BAD, EVT_AQM_GOOD
 
 log = logging.getLogger("aqm_announcer")
 
+# Pre-rendered phrases live here, named by a hash of the full synth argv,
+# so a restart with unchanged config reuses them and any change re-renders.
+_CLIP_DIR = os.path.join(tempfile.gettempdir(), "dustcollector-aqm")
+
+
+async def _run(cmd: tuple[str, ...], what: str) -> bool:
+    """Run a command to completion; log stderr and return False on failure."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        _out, err = await proc.communicate()
+    except Exception:
+        log.exception("%s failed to start", what)
+        return False
+    if proc.returncode != 0:
+        log.error(
+            "%s failed rc=%s err=%s",
+            what,
+            proc.returncode,
+            err.decode(errors="replace").strip(),
+        )
+        return False
+    return True
 
-def _cfg_get(cfg: Any, keys: list[str], default: Any) -> Any:
-    raw = getattr(cfg, "raw", None)
-    if not isinstance(raw, dict):
-        return default
-    cur: Any = raw
-    for k in keys:
-        if not isinstance(cur, dict) or k not in cur:
-            return default
-        cur = cur[k]
-    return cur
 
+def _announce_section(cfg: Any) -> dict:
+    """
+    Return the announcer config dict in one walk of cfg.raw.
 
-def _cfg_has_path(cfg: Any, keys: list[str]) -> bool:
+    Preferred location is top-level "announce:"; if that key is absent we
+    fall back to "aqm: announce:". Anything that is not a dict reads as {}
+    so every setting takes its default.
+    """
     raw = getattr(cfg, "raw", None)
     if not isinstance(raw, dict):
-        return False
-    cur: Any = raw
-    for k in keys:
-        if not isinstance(cur, dict) or k not in cur:
-            return False
-        cur = cur[k]
-    return True
+        return {}
+    if "announce" in raw:
+        sec = raw["announce"]
+    else:
+        aqm = raw.get("aqm")
+        sec = aqm.get("announce") if isinstance(aqm, dict) else None
+    return sec if isinstance(sec, dict) else {}
 
 
 @dataclass(frozen=True)
@@ -65,16 +90,15 @@ def _load_announcer_config(cfg: Any) -> AnnouncerConfig:
     Backward-compatible fallback:
       aqm: { announce: {...same keys...} }
     """
-    # Prefer top-level "announce:" if present, else fall back to "aqm: announce:"
-    use_top = _cfg_has_path(cfg, ["announce"])
-    base = ["announce"] if use_top else ["aqm", "announce"]
+    sec = _announce_section(cfg)
+    get = sec.get
 
-    enabled = bool(_cfg_get(cfg, base + ["enabled"], True))
-    min_s = float(_cfg_get(cfg, base + ["min_seconds_between"], 60.0))
-    engine = str(_cfg_get(cfg, base + ["engine"], "espeak-ng"))
-    voice = str(_cfg_get(cfg, base + ["voice"], "en-us"))
-    volume = int(_cfg_get(cfg, base + ["volume"], 200))
-    speed = int(_cfg_get(cfg, base + ["speed_wpm"], 155))
+    enabled = bool(get("enabled", True))
+    min_s = float(get("min_seconds_between", 60.0))
+    engine = str(get("engine", "espeak-ng"))
+    voice = str(get("voice", "en-us"))
+    volume = int(get("volume", 200))
+    speed = int(get("speed_wpm", 155))
 
     default_unsafe = (
         "Warning!! Warning!! Warning!! Air quality is no longer safe, "
@@ -82,8 +106,8 @@ def _load_announcer_config(cfg: Any) -> AnnouncerConfig:
     )
     default_safe = "All clear! Air quality is now considered safe."
 
-    unsafe_text = str(_cfg_get(cfg, base + ["unsafe_text"], default_unsafe))
-    safe_text = str(_cfg_get(cfg, base + ["safe_text"], default_safe))
+    unsafe_text = str(get("unsafe_text", default_unsafe))
+    safe_text = str(get("safe_text", default_safe))
 
     return AnnouncerConfig(
         enabled=enabled,
@@ -98,50 +122,69 @@ def _load_announcer_config(cfg: Any) -> AnnouncerConfig:
 
 
 class _Announcer:
-    def __init__(self, cfg: AnnouncerConfig) -> None:
+    def __init__(self, cfg: AnnouncerConfig, engine_path: str) -> None:
         self._cfg = cfg
         self._state: str | None = None
-        self._last_announce_ts = 0.0
-
-    async def _speak(self, text: str) -> None:
-        cfg = self._cfg
-
-        if shutil.which(cfg.engine) is None:
-            log.error("Speech engine not found: %s", cfg.engine)
-            return
+        self._next_ok_ts = 0.0  # monotonic time the next announcement is allowed
+        # Flattened from the frozen config; read on every AQM event.
+        self._min_gap = cfg.min_seconds_between_announcements
+        self._unsafe_text = cfg.unsafe_text
+        self._safe_text = cfg.safe_text
 
         # espeak-ng CLI is stable: -v, -a (amplitude), -s (speed).
         # If you switch engines later, we can branch on cfg.engine.
-        cmd = [
-            cfg.engine,
+        self._base_cmd: tuple[str, ...] = (
+            engine_path,
             "-v",
             cfg.voice,
             "-a",
             str(cfg.volume),
             "-s",
             str(cfg.speed_wpm),
-            text,
-        ]
-
+        )
+
+        # state -> cached WAV; filled by prerender() when a player exists
+        self._clips: dict[str, str] = {}
+        self._play_cmd: tuple[str, ...] = ()
+
+    async def prerender(self, player_path: str) -> None:
+        """
+        Synthesize both fixed phrases to WAV once so announcements only
+        need a playback process. States that fail to render fall back to
+        live synthesis in on_event.
+        """
         try:
-            proc = await asyncio.to_thread(
-                subprocess.run,
-                cmd,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            if proc.returncode != 0:
-                err = (proc.stderr or "").strip()
-                log.error("Speech engine failed rc=%s err=%s", proc.returncode, err)
-        except Exception:
-            log.exception("Speech announce failed")
-
-    async def on_event(self, ev_type: str) -> None:
-        if ev_type not in ("aqm.bad", "aqm.good"):
+            os.makedirs(_CLIP_DIR, exist_ok=True)
+        except OSError:
+            log.exception("Cannot create clip cache %s", _CLIP_DIR)
             return
+        for state, text in (("bad", self._unsafe_text), ("good", self._safe_text)):
+            cmd = self._base_cmd + (text,)
+            digest = hashlib.sha1("\0".join(cmd).encode()).hexdigest()[:16]
+            path = os.path.join(_CLIP_DIR, f"{state}-{digest}.wav")
+            if not os.path.exists(path):
+                tmp = path + ".tmp"
+                if not await _run(cmd[:-1] + ("-w", tmp, text), "Speech render"):
+                    # Don't leave a partial clip behind in the cache dir
+                    try:
+                        os.unlink(tmp)
+                    except OSError:
+                        pass
+                    continue
+                os.replace(tmp, path)
+            self._clips[state] = path
+        self._play_cmd = (player_path, "-q")
+        log.info("AQM announce clips ready: %s", ", ".join(sorted(self._clips)))
 
-        new_state = "bad" if ev_type == "aqm.bad" else "good"
+    async def _speak(self, text: str) -> None:
+        await _run(self._base_cmd + (text,), "Speech engine")
+
+    async def _play(self, path: str) -> None:
+        await _run(self._play_cmd + (path,), "Clip playback")
+
+    async def on_event(self, ev_type: str) -> None:
+        # Only aqm.bad / aqm.good reach here (see the subscription below).
+        new_state = "bad" if ev_type == EVT_AQM_BAD else "good"
         if self._state is None:
             self._state = new_state
             log.info("AQM announce baseline: %s", self._state)
@@ -151,20 +194,21 @@ class _Announcer:
             return
 
         now = time.monotonic()
-        if (
-            now - self._last_announce_ts
-            < self._cfg.min_seconds_between_announcements
-        ):
+        if now < self._next_ok_ts:
             log.info("AQM announce suppressed (rate limit): %s", new_state)
             self._state = new_state
             return
 
         self._state = new_state
-        self._last_announce_ts = now
+        self._next_ok_ts = now + self._min_gap
 
-        text = self._cfg.unsafe_text if new_state == "bad" else self._cfg.safe_text
+        text = self._unsafe_text if new_state == "bad" else self._safe_text
         log.warning("AQM announce: %s", text)
-        await self._speak(text)
+        clip = self._clips.get(new_state)
+        if clip is not None:
+            await self._play(clip)
+        else:
+            await self._speak(text)
 
 
 async def run_aqm_announcer(bus: EventBus, cfg: Any) -> None:
@@ -189,9 +233,24 @@ async def run_aqm_announcer(bus: EventBus, cfg: Any) -> None:
         _preview_text(a_cfg.unsafe_text),
     )
 
-    announcer = _Announcer(a_cfg)
-    q = bus.subscribe(maxsize=200)
+    # Resolve the engine once; PATH does not change under a running service.
+    engine_path = shutil.which(a_cfg.engine)
+    if engine_path is None:
+        log.error("Speech engine not found: %s (announcements disabled)", a_cfg.engine)
+        return
+
+    announcer = _Announcer(a_cfg, engine_path)
+    # Subscribe before prerendering so transitions published while the
+    # clips render are queued, not lost.
+    q = bus.subscribe(maxsize=16, types=(EVT_AQM_BAD, EVT_AQM_GOOD))
+    player_path: Optional[str] = shutil.which("aplay")
+    if player_path is not None:
+        await announcer.prerender(player_path)
+    else:
+        log.info("aplay not found; synthesizing each announcement live")
+    get = q.get
+    on_event = announcer.on_event
 
     while True:
-        ev = await q.get()
-        await announcer.on_event(getattr(ev, "type", ""))
+        ev = await get()
+        await on_event(getattr(ev, "type", ""))
@@ -5,10 +5,13 @@ import time
 from typing import Any, Optional
 
 from ..event_bus import EventBus
+from ..events import EVT_AQM_BAD, EVT_AQM_GOOD
 from ..hardware.gpio import GPIOOut
 
 log = logging.getLogger("aqm_policy")
 
+_AQM_STATES = frozenset((EVT_AQM_BAD, EVT_AQM_GOOD))
+
 
 def _cfg_get(cfg: Any, keys: list[str], default: Any) -> Any:
     raw = getattr(cfg, "raw", None)
@@ -37,6 +40,7 @@ async def run_aqm_policy(bus: EventBus, cfg: Any, *, ser_tx: Optional[Any]) -> N
     fan_on_when_bad = bool(_cfg_get(cfg, ["aqm", "fan_on_when_bad"], False))
     pause_fun = bool(_cfg_get(cfg, ["safety", "pause_fun_on_severe_aqm"], False))
     min_off_lockout_ms = float(_cfg_get(cfg, ["safety", "min_off_lockout_ms"], 0.0))
+    min_off_lockout_ns = int(min_off_lockout_ms * 1_000_000)
 
     fan_pin = int(_cfg_get(cfg, ["gpio", "fan_ssr"], 24))
     fan_active_high = bool(_cfg_get(cfg, ["gpio", "fan_active_high"], True))
@@ -51,7 +55,7 @@ async def run_aqm_policy(bus: EventBus, cfg: Any, *, ser_tx: Optional[Any]) -> N
     q = bus.subscribe(maxsize=200)
 
     fan_is_on = False
-    last_fan_off_at = time.monotonic()
+    last_fan_off_ns = time.perf_counter_ns()
 
     severe_latched = False
 
@@ -67,28 +71,28 @@ async def run_aqm_policy(bus: EventBus, cfg: Any, *, ser_tx: Optional[Any]) -> N
 
     while True:
         ev = await q.get()
-        if ev.type not in ("aqm.bad", "aqm.good"):
+        ev_type = ev.type
+        if ev_type not in _AQM_STATES:
             continue
 
-        is_bad = ev.type == "aqm.bad"
+        is_bad = ev_type == EVT_AQM_BAD
         severe = bool(ev.data.get("severe", False))
 
         # ---- Fan control ----
         if fan_on_when_bad:
             if is_bad:
                 if not fan_is_on:
-                    now = time.monotonic()
-
                     # After turning OFF, suppress turning ON for this lockout period.
-                    if min_off_lockout_ms > 0:
-                        elapsed_ms = (now - last_fan_off_at) * 1000.0
-                        if elapsed_ms < min_off_lockout_ms:
-                            log.info(
-                                "AQM policy: FAN ON suppressed by lockout "
-                                "(%.0fms < %.0fms)",
-                                elapsed_ms,
-                                min_off_lockout_ms,
-                            )
+                    if min_off_lockout_ns > 0:
+                        elapsed_ns = time.perf_counter_ns() - last_fan_off_ns
+                        if elapsed_ns < min_off_lockout_ns:
+                            if log.isEnabledFor(logging.INFO):
+                                log.info(
+                                    "AQM policy: FAN ON suppressed by lockout "
+                                    "(%.0fms < %.0fms)",
+                                    elapsed_ns / 1e6,
+                                    min_off_lockout_ms,
+                                )
                             continue
 
                     try:
@@ -102,7 +106,7 @@ async def run_aqm_policy(bus: EventBus, cfg: Any, *, ser_tx: Optional[Any]) -> N
                     try:
                         fan.write(False)
                         fan_is_on = False
-                        last_fan_off_at = time.monotonic()
+                        last_fan_off_ns = time.perf_counter_ns()
                         log.info("AQM policy: FAN OFF (good air)")
                     except Exception:
                         log.exception("AQM policy: FAN OFF failed")
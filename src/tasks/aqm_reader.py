@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import struct
+import threading
 import time
-from collections import deque
-from typing import Any, Deque, Optional
+from typing import Any, List, Optional, Tuple, Union
 
-from ..events import Event
+from ..events import EVT_AQM_BAD, EVT_AQM_GOOD, EVT_AQM_METRICS, Event
 from ..event_bus import EventBus
 
 log = logging.getLogger("aqm_reader")
@@ -14,6 +15,15 @@ log = logging.getLogger("aqm_reader")
 START1 = 0x42
 START2 = 0x4D
 FRAME_LEN = 32
+FRAME_HEADER = bytes((START1, START2))
+
+# Three big-endian u16 PM readings; CF=1 block at byte 4, atmospheric at 10
+_PM_FIELDS = struct.Struct(">HHH")
+_CF1_OFFSET = 4
+_ATM_OFFSET = 10
+# Big-endian u16 checksum in the last two bytes
+_CHECKSUM = struct.Struct(">H")
+_CHECKSUM_OFFSET = FRAME_LEN - 2
 
 
 # Adafruit SSD1306 OLED support (SSD1306 128x64 over I2C @ 0x3C).
@@ -54,47 +64,57 @@ def _checksum_ok(frame: bytes) -> bool:
     """
     if len(frame) != FRAME_LEN:
         return False
-    expected = (frame[30] << 8) | frame[31]
-    actual = sum(frame[:30]) & 0xFFFF
+    # unpack_from reads in place: no slice copy for either field
+    (expected,) = _CHECKSUM.unpack_from(frame, _CHECKSUM_OFFSET)
+    # Whole-frame sum minus the checksum bytes
+    actual = (sum(frame) - (expected >> 8) - (expected & 0xFF)) & 0xFFFF
     return actual == expected
 
 
-def _find_frame_blocking(ser: Any) -> Optional[bytes]:
+def _find_frame_blocking(ser: Any, buf: bytearray) -> Optional[bytes]:
     """
-    Blocking scan for 0x42 0x4D, then read the remaining 30 bytes.
+    Blocking scan for 0x42 0x4D followed by a valid 32-byte frame.
+
+    Reads in chunks (whatever is waiting, at least enough to finish the
+    current frame) and searches them with bytearray.find instead of issuing
+    one read(1) per byte. `buf` is owned by the caller and carries bytes
+    past the returned frame into the next call.
 
     Returns:
       - a valid 32-byte frame
       - None on timeout / EOF-ish behavior
     """
     while True:
-        b1 = ser.read(1)
-        if not b1:
-            return None
-        if b1[0] != START1:
-            continue
-
-        b2 = ser.read(1)
-        if not b2:
-            return None
-        if b2[0] != START2:
-            continue
-
-        rest = ser.read(30)
-        if len(rest) != 30:
+        idx = buf.find(FRAME_HEADER)
+        if idx < 0:
+            # Keep a trailing START1: its START2 may be in the next read.
+            if buf[-1:] == FRAME_HEADER[:1]:
+                del buf[:-1]
+            else:
+                buf.clear()
+            need = FRAME_LEN - len(buf)
+        else:
+            if idx:
+                del buf[:idx]
+            if len(buf) >= FRAME_LEN:
+                frame = bytes(buf[:FRAME_LEN])
+                if _checksum_ok(frame):
+                    del buf[:FRAME_LEN]
+                    return frame
+                # Checksum failed; resync past this header.
+                del buf[:2]
+                continue
+            need = FRAME_LEN - len(buf)
+
+        data = ser.read(max(need, getattr(ser, "in_waiting", 0) or 0))
+        if not data:
             return None
-
-        frame = b1 + b2 + rest
-        if _checksum_ok(frame):
-            return frame
-
-        # Checksum failed; resync by continuing scan.
-        continue
+        buf += data
 
 
-def _parse_metrics(frame: bytes, use_cf1: bool) -> dict[str, int]:
+def _parse_metrics(frame: bytes, use_cf1: bool) -> Tuple[int, int, int]:
     """
-    Plantower PMS frame fields:
+    Plantower PMS frame fields, returned as (pm1_0, pm2_5, pm10):
       CF=1:
         PM1.0  bytes 4-5
         PM2.5  bytes 6-7
@@ -104,15 +124,7 @@ def _parse_metrics(frame: bytes, use_cf1: bool) -> dict[str, int]:
         PM2.5  bytes 12-13
         PM10   bytes 14-15
     """
-    if use_cf1:
-        pm1_0 = (frame[4] << 8) | frame[5]
-        pm2_5 = (frame[6] << 8) | frame[7]
-        pm10 = (frame[8] << 8) | frame[9]
-    else:
-        pm1_0 = (frame[10] << 8) | frame[11]
-        pm2_5 = (frame[12] << 8) | frame[13]
-        pm10 = (frame[14] << 8) | frame[15]
-    return {"pm1_0": int(pm1_0), "pm2_5": int(pm2_5), "pm10": int(pm10)}
+    return _PM_FIELDS.unpack_from(frame, _CF1_OFFSET if use_cf1 else _ATM_OFFSET)
 
 
 def _clamp_bad_off_threshold(bad_off_th: int, bad_on_th: int) -> int:
@@ -121,12 +133,56 @@ def _clamp_bad_off_threshold(bad_off_th: int, bad_on_th: int) -> int:
     return bad_off_th
 
 
-def _avg_last(hist: Deque[int], n: int) -> int:
-    if n <= 1 or len(hist) <= 1:
-        return int(hist[-1])
-    k = min(n, len(hist))
-    tail = list(hist)[-k:]
-    return int(round(sum(tail) / k))
+class _PmWindow:
+    """
+    Rounded means of the last `window` (pm1_0, pm2_5, pm10) samples.
+
+    One preallocated ring of max_win sample tuples with a write index and a
+    running sum per channel, so each frame costs O(1) for all three averages.
+    The sums are recomputed only when the window size changes (GOOD/BAD
+    transitions).
+    """
+
+    __slots__ = ("_ring", "_size", "_widx", "_filled", "_window", "_sums")
+
+    def __init__(self, max_win: int) -> None:
+        self._ring: List[Tuple[int, int, int]] = [(0, 0, 0)] * max_win
+        self._size = max_win
+        self._widx = 0
+        self._filled = 0
+        self._window = 0
+        self._sums = (0, 0, 0)
+
+    def push(self, p1: int, p25: int, p10: int, window: int) -> Tuple[int, int, int]:
+        ring = self._ring
+        size = self._size
+        widx = self._widx
+        if window != self._window:
+            self._window = window
+            s1 = s25 = s10 = 0
+            for i in range(1, min(window, self._filled) + 1):
+                o1, o25, o10 = ring[(widx - i) % size]
+                s1 += o1
+                s25 += o25
+                s10 += o10
+        else:
+            s1, s25, s10 = self._sums
+        if self._filled >= window:
+            # Sample leaving the window; read before the slot is overwritten
+            o1, o25, o10 = ring[(widx - window) % size]
+            s1 -= o1
+            s25 -= o25
+            s10 -= o10
+        ring[widx] = (p1, p25, p10)
+        self._widx = (widx + 1) % size
+        if self._filled < size:
+            self._filled += 1
+        s1 += p1
+        s25 += p25
+        s10 += p10
+        self._sums = (s1, s25, s10)
+        n = min(window, self._filled)
+        return int(round(s1 / n)), int(round(s25 / n)), int(round(s10 / n))
 
 
 class _Oled:
@@ -138,8 +194,13 @@ class _Oled:
       2) PM1.0: <val>
       3) PM2.5: <val>
       4) PM10 : <val>
+
+    The fixed labels and the whole WAITING screen are rendered once into
+    template images; show() pastes the template and draws only the values.
     """
 
+    _LABELS = ((16, "PM1.0: "), (32, "PM2.5: "), (48, "PM10 : "))
+
     def __init__(self) -> None:
         self.enabled = False
         self._disp = None
@@ -148,6 +209,9 @@ class _Oled:
         self._image = None
         self._draw = None
         self._font = None
+        self._bg = None  # labels only
+        self._waiting = None  # complete WAITING screen
+        self._value_xy: tuple[tuple[int, int], ...] = ()
         self._last_payload: Optional[str] = None
 
         if not OLED_OK:
@@ -162,15 +226,30 @@ class _Oled:
             self._image = Image.new("1", (self._w, self._h))
             self._draw = ImageDraw.Draw(self._image)
             self._font = ImageFont.load_default()
+            self._build_templates()
             self.enabled = True
             self.show_waiting()
             log.info("OLED: init OK (SSD1306 128x64 @ 0x3C).")
         except Exception as e:
             log.warning("OLED: init FAILED; disabled: %s", e)
 
-    def _clear(self) -> None:
-        assert self._draw is not None
-        self._draw.rectangle((0, 0, self._w, self._h), outline=0, fill=0)
+    def _build_templates(self) -> None:
+        size = (self._w, self._h)
+        font = self._font
+
+        self._bg = Image.new("1", size)
+        bg_draw = ImageDraw.Draw(self._bg)
+        xy = []
+        for y, label in self._LABELS:
+            bg_draw.text((0, y), label, font=font, fill=255)
+            xy.append((int(bg_draw.textlength(label, font=font)), y))
+        self._value_xy = tuple(xy)
+
+        self._waiting = Image.new("1", size)
+        w_draw = ImageDraw.Draw(self._waiting)
+        w_draw.text((0, 0), "AQM: WAITING", font=font, fill=255)
+        w_draw.text((0, 16), "for PMS1003", font=font, fill=255)
+        w_draw.text((0, 32), "frames...", font=font, fill=255)
 
     def _flush(self) -> None:
         assert self._disp is not None
@@ -181,50 +260,88 @@ class _Oled:
     def show_waiting(self) -> None:
         if not self.enabled:
             return
-        assert self._draw is not None
-        assert self._font is not None
+        assert self._image is not None
 
         payload = "WAITING"
         if payload == self._last_payload:
             return
         self._last_payload = payload
 
-        self._clear()
-        self._draw.text((0, 0), "AQM: WAITING", font=self._font, fill=255)
-        self._draw.text((0, 16), "for PMS1003", font=self._font, fill=255)
-        self._draw.text((0, 32), "frames...", font=self._font, fill=255)
+        self._image.paste(self._waiting)
         self._flush()
 
     def show(self, status: str, pm1_0: int, pm2_5: int, pm10: int) -> None:
         if not self.enabled:
             return
         assert self._draw is not None
-        assert self._font is not None
+        assert self._image is not None
 
         payload = f"{status}|{pm1_0}|{pm2_5}|{pm10}"
         if payload == self._last_payload:
             return
         self._last_payload = payload
 
-        self._clear()
-        self._draw.text((0, 0), status, font=self._font, fill=255)
-        self._draw.text((0, 16), f"PM1.0: {pm1_0}", font=self._font, fill=255)
-        self._draw.text((0, 32), f"PM2.5: {pm2_5}", font=self._font, fill=255)
-        self._draw.text((0, 48), f"PM10 : {pm10}", font=self._font, fill=255)
+        draw = self._draw
+        font = self._font
+        xy1, xy25, xy10 = self._value_xy
+        self._image.paste(self._bg)
+        draw.text((0, 0), status, font=font, fill=255)
+        draw.text(xy1, str(pm1_0), font=font, fill=255)
+        draw.text(xy25, str(pm2_5), font=font, fill=255)
+        draw.text(xy10, str(pm10), font=font, fill=255)
         self._flush()
 
 
+def _reader_thread(
+    ser: Any,
+    loop: asyncio.AbstractEventLoop,
+    frame_q: asyncio.Queue,
+    stop: threading.Event,
+) -> None:
+    """
+    Long-running serial reader: pushes each frame (or None on timeout) onto
+    frame_q from the loop thread. Exits when `stop` is set or the loop closes.
+    A read error is pushed as the exception itself and ends the thread.
+    """
+    rx_buf = bytearray()
+
+    def _deliver(item: Union[bytes, Exception, None]) -> None:
+        # Runs on the loop. Keep the newest frames if the consumer lags.
+        if frame_q.full():
+            frame_q.get_nowait()
+        frame_q.put_nowait(item)
+
+    while not stop.is_set():
+        try:
+            frame = _find_frame_blocking(ser, rx_buf)
+        except Exception as exc:
+            # Timeouts already come back as None; an exception means the
+            # port is gone. Let aqm_reader raise it so the TaskGroup fails
+            # and systemd restarts the service, instead of retrying here.
+            try:
+                loop.call_soon_threadsafe(_deliver, exc)
+            except RuntimeError:
+                pass  # loop closed
+            return
+        try:
+            loop.call_soon_threadsafe(_deliver, frame)
+        except RuntimeError:
+            return  # loop closed
+
+
 async def aqm_reader(bus: EventBus, cfg: Any, hw: Any) -> None:
     """
     RX-only PMS reader using the proven blocking header-scan algorithm,
-    executed in a thread (asyncio.to_thread) so we don't block the event loop.
+    run on one dedicated thread for the life of the task so we don't block
+    the event loop; frames are handed back through a small asyncio.Queue.
 
     Publishes:
       - aqm.metrics {pm1_0, pm2_5, pm10, ...}
       - aqm.good / aqm.bad {pm2_5, severe}
 
     OLED:
-      - updates every valid frame (status + three readings)
+      - status + three readings; redrawn immediately when the status changes,
+        otherwise at most every aqm.oled_min_interval_s (default 0.5 s)
 
     Adaptive filtering:
       - filter_window_good is used when air is GOOD
@@ -265,9 +382,7 @@ async def aqm_reader(bus: EventBus, cfg: Any, hw: Any) -> None:
 
     max_win = max(win_good, win_bad)
 
-    pm1_hist: Deque[int] = deque(maxlen=max_win)
-    pm25_hist: Deque[int] = deque(maxlen=max_win)
-    pm10_hist: Deque[int] = deque(maxlen=max_win)
+    pm_avg = _PmWindow(max_win)
 
     bad_on_th = int(_cfg_get(cfg, ["aqm", "bad_threshold"], 35))
     sev_th = int(_cfg_get(cfg, ["aqm", "severe_threshold"], 75))
@@ -278,9 +393,24 @@ async def aqm_reader(bus: EventBus, cfg: Any, hw: Any) -> None:
 
     use_cf1 = bool(_cfg_get(cfg, ["aqm", "use_cf1"], True))
 
+    # A full OLED refresh is ~1 KiB over I2C: redraw on status changes, but
+    # otherwise at most once per oled_min_interval_s.
+    oled_min_interval_s = float(_cfg_get(cfg, ["aqm", "oled_min_interval_s"], 0.5))
+
+    # aqm.metrics thinning: publish the first frame and then every Nth, or
+    # sooner when a filtered reading moves by at least min_delta (0 disables
+    # the delta trigger). Defaults publish every frame. aqm.bad/aqm.good are
+    # always published.
+    metrics_every_n = max(1, int(_cfg_get(cfg, ["aqm", "metrics_publish_every_n"], 1)))
+    metrics_min_delta = int(_cfg_get(cfg, ["aqm", "metrics_publish_min_delta"], 0))
+    frame_idx = 0
+    last_pub_pm = (-1, -1, -1)  # filtered (pm1_0, pm2_5, pm10) last published
+
     is_bad = False
     last_is_bad: Optional[bool] = None
     oled = _Oled()
+    last_oled_status: Optional[str] = None
+    last_oled_t = 0.0
 
     last_pm25: Optional[int] = None
     last_pub_t = time.monotonic()
@@ -299,91 +429,126 @@ async def aqm_reader(bus: EventBus, cfg: Any, hw: Any) -> None:
         show_values,
     )
 
-    while True:
-        frame = await asyncio.to_thread(_find_frame_blocking, ser)
-        if frame is None:
-            oled.show_waiting()
-            await asyncio.sleep(0.1)
-            continue
-
-        metrics_raw = _parse_metrics(frame, use_cf1=use_cf1)
-        pm1_0_raw = int(metrics_raw["pm1_0"])
-        pm25_raw = int(metrics_raw["pm2_5"])
-        pm10_raw = int(metrics_raw["pm10"])
-
-        pm1_hist.append(pm1_0_raw)
-        pm25_hist.append(pm25_raw)
-        pm10_hist.append(pm10_raw)
-
-        # Use heavier filtering when we are currently BAD.
-        win_cur = win_bad if is_bad else win_good
-
-        pm1_0 = _avg_last(pm1_hist, win_cur)
-        pm25 = _avg_last(pm25_hist, win_cur)
-        pm10 = _avg_last(pm10_hist, win_cur)
-
-        now_t = time.monotonic()
-        dt = now_t - last_pub_t
-        last_pub_t = now_t
-
-        changed = (last_pm25 is None) or (pm25 != last_pm25)
-        last_pm25 = pm25
-
-        if show_values:
-            log.warning(
-                "AQM: dt=%.2fs pm2_5=%d(raw=%d) %s pm1_0=%d(raw=%d) pm10=%d(raw=%d) "
-                "win=%d mode=%s",
-                dt,
-                pm25,
-                pm25_raw,
-                "CHANGED" if changed else "same",
-                pm1_0,
-                pm1_0_raw,
-                pm10,
-                pm10_raw,
-                win_cur,
-                "BAD" if is_bad else "GOOD",
-            )
-
-        await bus.publish(
-            Event.now(
-                "aqm.metrics",
-                "aqm.pms1003",
-                pm1_0=pm1_0,
-                pm2_5=pm25,
-                pm10=pm10,
-                pm1_0_raw=pm1_0_raw,
-                pm2_5_raw=pm25_raw,
-                pm10_raw=pm10_raw,
-                filter_window=win_cur,
-                filter_window_good=win_good,
-                filter_window_bad=win_bad,
-            )
-        )
-
-        # Hysteresis on FILTERED pm2.5
-        if is_bad:
-            if pm25 <= bad_off_th:
-                is_bad = False
-        else:
-            if pm25 >= bad_on_th:
-                is_bad = True
-
-        severe = pm25 >= sev_th
-
-        if last_is_bad is None or is_bad != last_is_bad:
-            await bus.publish(
-                Event.now(
-                    "aqm.bad" if is_bad else "aqm.good",
-                    "aqm.pms1003",
-                    pm2_5=pm25,
-                    pm2_5_raw=pm25_raw,
-                    severe=severe,
+    loop = asyncio.get_running_loop()
+    frame_q: asyncio.Queue[Union[bytes, Exception, None]] = asyncio.Queue(maxsize=4)
+    stop = threading.Event()
+    threading.Thread(
+        target=_reader_thread,
+        args=(ser, loop, frame_q, stop),
+        name="aqm_reader_rx",
+        daemon=True,
+    ).start()
+
+    next_deadline = time.monotonic() + interval_s
+
+    try:
+        while True:
+            frame = await frame_q.get()
+            if isinstance(frame, Exception):
+                raise frame
+            if frame is None:
+                oled.show_waiting()
+                await asyncio.sleep(0.1)
+                continue
+
+            pm1_0_raw, pm25_raw, pm10_raw = _parse_metrics(frame, use_cf1)
+
+            # Use heavier filtering when we are currently BAD.
+            win_cur = win_bad if is_bad else win_good
+
+            pm1_0, pm25, pm10 = pm_avg.push(pm1_0_raw, pm25_raw, pm10_raw, win_cur)
+
+            now_t = time.monotonic()
+            dt = now_t - last_pub_t
+            last_pub_t = now_t
+
+            changed = (last_pm25 is None) or (pm25 != last_pm25)
+            last_pm25 = pm25
+
+            if show_values:
+                log.warning(
+                    "AQM: dt=%.2fs pm2_5=%d(raw=%d) %s pm1_0=%d(raw=%d) pm10=%d(raw=%d) "
+                    "win=%d mode=%s",
+                    dt,
+                    pm25,
+                    pm25_raw,
+                    "CHANGED" if changed else "same",
+                    pm1_0,
+                    pm1_0_raw,
+                    pm10,
+                    pm10_raw,
+                    win_cur,
+                    "BAD" if is_bad else "GOOD",
                 )
-            )
-            last_is_bad = is_bad
 
-        status = "SEVERE" if severe else ("BAD" if is_bad else "GOOD")
-        oled.show(status=status, pm1_0=pm1_0, pm2_5=pm25, pm10=pm10)
+            # Checked before counting, so frame 0 (the first) is published
+            publish_metrics = frame_idx % metrics_every_n == 0
+            frame_idx += 1
+            if not publish_metrics and metrics_min_delta > 0:
+                lp1, lp25, lp10 = last_pub_pm
+                publish_metrics = (
+                    abs(pm25 - lp25) >= metrics_min_delta
+                    or abs(pm1_0 - lp1) >= metrics_min_delta
+                    or abs(pm10 - lp10) >= metrics_min_delta
+                )
+            if publish_metrics:
+                last_pub_pm = (pm1_0, pm25, pm10)
+                await bus.publish(
+                    Event.now(
+                        EVT_AQM_METRICS,
+                        "aqm.pms1003",
+                        pm1_0=pm1_0,
+                        pm2_5=pm25,
+                        pm10=pm10,
+                        pm1_0_raw=pm1_0_raw,
+                        pm2_5_raw=pm25_raw,
+                        pm10_raw=pm10_raw,
+                        filter_window=win_cur,
+                        filter_window_good=win_good,
+                        filter_window_bad=win_bad,
+                    )
+                )
 
-        await asyncio.sleep(interval_s)
+            # Hysteresis on FILTERED pm2.5
+            if is_bad:
+                if pm25 <= bad_off_th:
+                    is_bad = False
+            else:
+                if pm25 >= bad_on_th:
+                    is_bad = True
+
+            severe = pm25 >= sev_th
+
+            if last_is_bad is None or is_bad != last_is_bad:
+                await bus.publish(
+                    Event.now(
+                        EVT_AQM_BAD if is_bad else EVT_AQM_GOOD,
+                        "aqm.pms1003",
+                        pm2_5=pm25,
+                        pm2_5_raw=pm25_raw,
+                        severe=severe,
+                    )
+                )
+                last_is_bad = is_bad
+
+            status = "SEVERE" if severe else ("BAD" if is_bad else "GOOD")
+            if (
+                status != last_oled_status
+                or now_t - last_oled_t >= oled_min_interval_s
+            ):
+                oled.show(status=status, pm1_0=pm1_0, pm2_5=pm25, pm10=pm10)
+                last_oled_status = status
+                last_oled_t = now_t
+
+            # Pace to a fixed cadence rather than sleeping a full interval
+            # after the work; resync if we fall a whole interval behind.
+            now = time.monotonic()
+            delay = next_deadline - now
+            if delay <= -interval_s:
+                next_deadline = now + interval_s
+            else:
+                next_deadline += interval_s
+                if delay > 0:
+                    await asyncio.sleep(delay)
+    finally:
+        stop.set()
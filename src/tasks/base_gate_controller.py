@@ -6,6 +6,7 @@ from dataclasses import dataclass
 
 from ..event_bus import EventBus
 from ..hardware.pcf_leds import PcfLedPair, PcfLedsConfig
+from ..hardware.pcf8574 import BIT
 from ..hardware.pcf_relays import PcfRelays
 
 log = logging.getLogger(__name__)
@@ -59,59 +60,90 @@ class BaseGateController:
             )
         )
         
-        self.motion_task: asyncio.Task[None] | None = None
+        # Direction of the current/last motion ("open"/"close"); a repeat
+        # event for it is ignored while that motion is still running
+        self._target: str | None = None
+
+        # Last LED colour written ("green"/"red"); None until the first write
+        self._last_led: str | None = None
+
+        # Relay masks for PcfRelays.set_mask: one port write per step
+        self._open_mask = BIT[config.relay_open_bit]
+        self._close_mask = BIT[config.relay_close_bit]
+        self._both_mask = self._open_mask | self._close_mask
+
+        # Pending relay steps of the current motion (loop.call_later handles)
+        self._motion_timers: list[asyncio.TimerHandle] = []
+
+    def _led_green(self) -> None:
+        if self._last_led != "green":
+            self.leds.set_green()
+            self._last_led = "green"
+
+    def _led_red(self) -> None:
+        if self._last_led != "red":
+            self.leds.set_red()
+            self._last_led = "red"
+
+    # Relay access: relay_lock is shared by every controller on relays@0x21.
+    # No holder awaits while holding it, so the timer callbacks below (which
+    # run on the loop between awaits) can never interleave with a locked
+    # section and call the relays directly.
+
+    def _stop_now(self) -> None:
+        """Stop both relays."""
+        self.relays.set_mask(mask_clear=self._both_mask)
 
     async def _relay_stop(self) -> None:
         """Stop both relays."""
         async with self.relay_lock:
-            self.relays.stop_pair(
-                self.config.relay_open_bit,
-                self.config.relay_close_bit
-            )
+            self._stop_now()
 
-    async def _relay_start_open(self) -> None:
-        """Start opening the gate (with deadtime protection)."""
-        async with self.relay_lock:
-            self.relays.set_relay(self.config.relay_close_bit, False)
-        await asyncio.sleep(RELAY_DEADTIME_S)
-        async with self.relay_lock:
-            self.relays.set_relay(self.config.relay_open_bit, True)
+    def _on_motion_timeout(self) -> None:
+        self._motion_timers = []
+        self._stop_now()
 
-    async def _relay_start_close(self) -> None:
-        """Start closing the gate (with deadtime protection)."""
-        async with self.relay_lock:
-            self.relays.set_relay(self.config.relay_open_bit, False)
-        await asyncio.sleep(RELAY_DEADTIME_S)
+    async def _start_motion(self, off_mask: int, on_mask: int) -> None:
+        """
+        Start a timed gate motion in one critical section: release off_mask
+        now, energize on_mask after RELAY_DEADTIME_S, stop both after a
+        further MAX_DRIVE_S. The later steps are loop timers, not a task.
+        """
+        loop = asyncio.get_running_loop()
+        set_mask = self.relays.set_mask
         async with self.relay_lock:
-            self.relays.set_relay(self.config.relay_close_bit, True)
+            self._cancel_timers()
+            set_mask(mask_clear=off_mask)
+            self._motion_timers = [
+                # Re-asserting off_mask costs nothing: same single write
+                loop.call_later(RELAY_DEADTIME_S, set_mask, off_mask, on_mask),
+                loop.call_later(
+                    RELAY_DEADTIME_S + MAX_DRIVE_S, self._on_motion_timeout
+                ),
+            ]
 
     async def _drive_open_then_stop(self) -> None:
         """Drive gate open for MAX_DRIVE_S, then stop."""
-        try:
-            await self._relay_start_open()
-            await asyncio.sleep(MAX_DRIVE_S)
-        finally:
-            await self._relay_stop()
+        await self._start_motion(self._close_mask, self._open_mask)
 
     async def _drive_close_then_stop(self) -> None:
         """Drive gate closed for MAX_DRIVE_S, then stop."""
-        try:
-            await self._relay_start_close()
-            await asyncio.sleep(MAX_DRIVE_S)
-        finally:
-            await self._relay_stop()
+        await self._start_motion(self._open_mask, self._close_mask)
+
+    def _cancel_timers(self) -> bool:
+        """Cancel pending motion steps; True if a motion was in progress."""
+        timers = self._motion_timers
+        if not timers:
+            return False
+        for h in timers:
+            h.cancel()
+        self._motion_timers = []
+        return True
 
     async def _cancel_motion(self) -> None:
-        """Cancel any in-progress motion task."""
-        if self.motion_task is None:
-            return
-        self.motion_task.cancel()
-        try:
-            await self.motion_task
-        except asyncio.CancelledError:
-            pass
-        finally:
-            self.motion_task = None
+        """Cancel any in-progress motion and stop its relays."""
+        if self._cancel_timers():
+            await self._relay_stop()
 
     async def run(self) -> None:
         """
@@ -124,7 +156,7 @@ class BaseGateController:
         q = self.bus.subscribe(maxsize=100)
 
         # Boot state: closed
-        self.leds.set_red()
+        self._led_red()
         await self._relay_stop()
         log.info(f"{self.config.name.upper()} CTRL: boot -> CLOSED (RED)")
 
@@ -133,20 +165,22 @@ class BaseGateController:
                 ev = await q.get()
 
                 if ev.type == self.config.event_on:
-                    self.leds.set_green()
+                    if self._target == "open" and self._motion_timers:
+                        continue
+                    self._target = "open"
+                    self._led_green()
                     log.info(f"{self.config.name.upper()} CTRL: OPEN (GREEN)")
                     await self._cancel_motion()
-                    self.motion_task = asyncio.create_task(
-                        self._drive_open_then_stop()
-                    )
+                    await self._drive_open_then_stop()
 
                 elif ev.type == self.config.event_off:
-                    self.leds.set_red()
+                    if self._target == "close" and self._motion_timers:
+                        continue
+                    self._target = "close"
+                    self._led_red()
                     log.info(f"{self.config.name.upper()} CTRL: CLOSE (RED)")
                     await self._cancel_motion()
-                    self.motion_task = asyncio.create_task(
-                        self._drive_close_then_stop()
-                    )
+                    await self._drive_close_then_stop()
 
         except asyncio.CancelledError:
             log.info(f"{self.config.name} gate controller cancelled")
@@ -5,6 +5,7 @@ import logging
 
 from ..config_loader import AppConfig
 from ..event_bus import EventBus
+from ..events import EVT_SYSTEM_ANY_ACTIVE
 
 log = logging.getLogger("collector_controller")
 
@@ -35,15 +36,21 @@ async def collector_controller(bus: EventBus, cfg: AppConfig, hw: object) -> Non
     collector_on = False
     log.info("collector_controller ready (OFF by default)")
 
-    q = bus.subscribe()
+    # Only system.any_active matters, and only its latest value: filtered at
+    # the bus and drained down to the newest event. Unbounded on purpose:
+    # publish() drops the NEWEST event on a full queue, which would leave
+    # the collector in a stale state.
+    q = bus.subscribe(types=(EVT_SYSTEM_ANY_ACTIVE,))
 
     while True:
         evt = await q.get()
+        while True:
+            try:
+                evt = q.get_nowait()
+            except asyncio.QueueEmpty:
+                break
 
-        if getattr(evt, "type", None) != "system.any_active":
-            continue
-
-        data = getattr(evt, "data", {}) or {}
+        data = evt.data  # always a Mapping on Event
         want_on = bool(data.get("value", False))
         active = data.get("active", [])
 
@@ -55,5 +62,3 @@ async def collector_controller(bus: EventBus, cfg: AppConfig, hw: object) -> Non
             hw.gpio_set_ssr(ssr, False)
             collector_on = False
             log.info("Collector OFF")
-
-        await asyncio.sleep(0)
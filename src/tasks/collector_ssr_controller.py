@@ -2,12 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
 from dataclasses import dataclass
 from typing import Any
 
 from ..config_loader import AppConfig
 from ..event_bus import EventBus
-from ..events import Event
 
 try:
     from ..hardware.gpio import GPIOOut
@@ -41,13 +41,32 @@ def _load_cfg(app_cfg: AppConfig) -> CollectorSsrConfig:
     if tools_raw is None:
         tools = ("saw", "lathe")
     elif isinstance(tools_raw, (list, tuple)):
-        tools = tuple(str(x).strip().lower() for x in tools_raw if str(x).strip())
+        # Normalize each entry once; dict.fromkeys drops repeats, keeping order
+        tools = tuple(dict.fromkeys(t for t in (str(x).strip().lower() for x in tools_raw) if t))
     else:
         tools = ("saw", "lathe")
 
     return CollectorSsrConfig(pin_bcm=pin, active_high=active_high, tools=tools)
 
 
+def _build_dispatch(tools: tuple[str, ...]) -> dict[str, tuple[int, bool]]:
+    """
+    Map "<tool>.on"/"<tool>.off" event types to (bit, on), built once.
+    tools[i] owns bit 1 << i of the controller's active mask.
+    """
+    dispatch: dict[str, tuple[int, bool]] = {}
+    for i, tool in enumerate(tools):
+        bit = 1 << i
+        dispatch[sys.intern(f"{tool}.on")] = (bit, True)
+        dispatch[sys.intern(f"{tool}.off")] = (bit, False)
+    return dispatch
+
+
+def _active_tools(tools: tuple[str, ...], mask: int) -> list[str]:
+    """Decode an active mask back to tool names (for logging only)."""
+    return sorted(t for i, t in enumerate(tools) if mask >> i & 1)
+
+
 async def run_collector_ssr_controller(bus: EventBus, app_cfg: AppConfig) -> None:
     """
     Collector SSR controller.
@@ -62,6 +81,8 @@ async def run_collector_ssr_controller(bus: EventBus, app_cfg: AppConfig) -> Non
       (published by adc_watch.py)
     """
     cfg = _load_cfg(app_cfg)
+    tools = cfg.tools
+    dispatch = _build_dispatch(tools)
 
     # In mock mode or when outputs are inhibited, we should never touch real GPIO.
     if app_cfg.mock or not _outputs_enabled(app_cfg):
@@ -71,19 +92,20 @@ async def run_collector_ssr_controller(bus: EventBus, app_cfg: AppConfig) -> Non
             _outputs_enabled(app_cfg),
         )
         # Still consume events so behavior is testable in logs if desired.
-        q = bus.subscribe()
-        active: set[str] = set()
+        q = bus.subscribe(types=dispatch)
+        get = q.get
+        active_mask = 0
         try:
             while True:
-                ev = await q.get()
-                if not isinstance(ev, Event):
+                ev = await get()
+                hit = dispatch.get(ev.type)
+                if hit is None:
                     continue
-                for tool in cfg.tools:
-                    if ev.type == f"{tool}.on":
-                        active.add(tool)
-                    elif ev.type == f"{tool}.off":
-                        active.discard(tool)
-                await asyncio.sleep(0)
+                bit, on = hit
+                if on:
+                    active_mask |= bit
+                else:
+                    active_mask &= ~bit
         except asyncio.CancelledError:
             raise
     
@@ -108,43 +130,43 @@ async def run_collector_ssr_controller(bus: EventBus, app_cfg: AppConfig) -> Non
         "Collector SSR controller ready (pin=%s active_high=%s tools=%s) [OFF]",
         cfg.pin_bcm,
         cfg.active_high,
-        list(cfg.tools),
+        list(tools),
     )
 
-    q = bus.subscribe()
-    active: set[str] = set()
+    # The bus keeps the dispatch keys as a frozenset and only queues
+    # tool on/off events here; aqm.metrics etc. never reach this task.
+    q = bus.subscribe(types=dispatch)
+    get = q.get
+    get_nowait = q.get_nowait
+    active_mask = 0
 
     try:
         while True:
-            ev = await q.get()
-            if not isinstance(ev, Event):
-                continue
-
-            changed = False
-            for tool in cfg.tools:
-                if ev.type == f"{tool}.on":
-                    if tool not in active:
-                        active.add(tool)
-                        changed = True
-                elif ev.type == f"{tool}.off":
-                    if tool in active:
-                        active.remove(tool)
-                        changed = True
-
-            if not changed:
-                continue
-
-            want_on = bool(active)
+            ev = await get()
+            # Apply the whole ready burst before touching the SSR, so e.g.
+            # saw.off + lathe.on back-to-back costs no GPIO write at all.
+            while True:
+                hit = dispatch.get(ev.type)
+                if hit is not None:
+                    bit, on = hit
+                    if on:
+                        active_mask |= bit
+                    else:
+                        active_mask &= ~bit
+                try:
+                    ev = get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+
+            want_on = active_mask != 0
             if want_on and not ssr_on:
                 blower_on()
                 ssr_on = True
-                log.info("Collector ON (active=%s)", sorted(active))
+                log.info("Collector ON (active=%s)", _active_tools(tools, active_mask))
             elif (not want_on) and ssr_on:
                 blower_off()
                 ssr_on = False
                 log.info("Collector OFF")
-
-            await asyncio.sleep(0)
     except asyncio.CancelledError:
         log.info("Collector SSR controller cancelled; forcing OFF")
         try:
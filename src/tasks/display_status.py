@@ -1,15 +1,30 @@
 from __future__ import annotations
 import logging
 from ..event_bus import EventBus
+from ..events import (
+    EVT_AQM_BAD,
+    EVT_AQM_GOOD,
+    EVT_MACHINE_OFF,
+    EVT_MACHINE_ON,
+    EVT_SYSTEM_ANY_ACTIVE,
+)
 
 log = logging.getLogger("display_status")
 
+_STATUS_TYPES = frozenset(
+    (EVT_MACHINE_ON, EVT_MACHINE_OFF, EVT_SYSTEM_ANY_ACTIVE, EVT_AQM_GOOD, EVT_AQM_BAD)
+)
+
 
 async def display_status(bus: EventBus, cfg, hw):
-    q = bus.subscribe()
+    # The only output is debug logging: without it, don't subscribe at all.
+    if not log.isEnabledFor(logging.DEBUG):
+        log.info("display_status disabled (debug logging off)")
+        return
+    q = bus.subscribe(types=_STATUS_TYPES)
+    get = q.get
     log.info("display_status started")
     while True:
-        ev = await q.get()
+        ev = await get()
         # keep this quiet unless you want chatty output
-        if ev.type in ("machine.on", "machine.off", "system.any_active", "aqm.good", "aqm.bad"):
-            log.debug("status: %s %s", ev.type, ev.data)
+        log.debug("status: %s %s", ev.type, ev.data)
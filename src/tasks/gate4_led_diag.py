@@ -17,8 +17,9 @@ from __future__ import annotations
 import asyncio
 import logging
 from dataclasses import dataclass
+from itertools import cycle
 
-from smbus2 import SMBus
+from smbus2 import SMBus, i2c_msg
 
 log = logging.getLogger(__name__)
 
@@ -82,28 +83,25 @@ async def run_gate4_led_diag(
         # Start with both OFF (logical OFF)
         cur = _set_led_bit(cur, mapping.green_bit, on=False, active_low=mapping.active_low)
         cur = _set_led_bit(cur, mapping.red_bit, on=False, active_low=mapping.active_low)
-        bus.write_byte(mapping.addr, cur)
-
-        while True:
-            # GREEN on
-            cur = _set_led_bit(cur, mapping.green_bit, on=True, active_low=mapping.active_low)
-            bus.write_byte(mapping.addr, cur)
-            await asyncio.sleep(on_sec)
-
-            # GREEN off
-            cur = _set_led_bit(cur, mapping.green_bit, on=False, active_low=mapping.active_low)
-            bus.write_byte(mapping.addr, cur)
-            await asyncio.sleep(gap_sec)
-
-            # RED on
-            cur = _set_led_bit(cur, mapping.red_bit, on=True, active_low=mapping.active_low)
-            bus.write_byte(mapping.addr, cur)
-            await asyncio.sleep(on_sec)
-
-            # RED off
-            cur = _set_led_bit(cur, mapping.red_bit, on=False, active_low=mapping.active_low)
-            bus.write_byte(mapping.addr, cur)
-            await asyncio.sleep(rest_sec)
+
+        # Only the LED bits ever change, so every phase byte is fixed: from
+        # both-OFF, flipping an LED's bit turns it ON for either polarity.
+        # Write messages carry constant data, so they are built once and
+        # reused for every i2c_rdwr.
+        both_off = i2c_msg.write(mapping.addr, [cur])
+        green_on = i2c_msg.write(mapping.addr, [cur ^ _mask(mapping.green_bit)])
+        red_on = i2c_msg.write(mapping.addr, [cur ^ _mask(mapping.red_bit)])
+        bus.i2c_rdwr(both_off)
+
+        schedule = (
+            (green_on, on_sec),    # GREEN on
+            (both_off, gap_sec),   # GREEN off
+            (red_on, on_sec),      # RED on
+            (both_off, rest_sec),  # RED off
+        )
+        for msg, delay in cycle(schedule):
+            bus.i2c_rdwr(msg)
+            await asyncio.sleep(delay)
 
     except asyncio.CancelledError:
         log.info("Gate4 LED diag cancelled; restoring PCF byte")
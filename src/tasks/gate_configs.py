@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import asyncio
+
+from ..event_bus import EventBus
+from ..events import EVT_LATHE_OFF, EVT_LATHE_ON, EVT_SAW_OFF, EVT_SAW_ON
+from ..hardware.pcf_relays import PcfRelays
+from .base_gate_controller import BaseGateController, GateConfig
+
+# LED bits on PCF @ 0x20, relay bits on PCF @ 0x21.
+# Canonical relay convention (empirically verified): the odd bit of each
+# pair is CLOSE, the even bit is OPEN.
+
+# Saw
+SAW_LED_GREEN_BIT = 6
+SAW_LED_RED_BIT = 2
+SAW_RELAY_CLOSE_BIT = 7
+SAW_RELAY_OPEN_BIT = 6
+
+# Lathe
+LATHE_LED_GREEN_BIT = 7
+LATHE_LED_RED_BIT = 3
+LATHE_RELAY_CLOSE_BIT = 5
+LATHE_RELAY_OPEN_BIT = 4
+
+GATE_CONFIGS: dict[str, GateConfig] = {
+    "saw": GateConfig(
+        name="saw",
+        event_on=EVT_SAW_ON,
+        event_off=EVT_SAW_OFF,
+        led_green_bit=SAW_LED_GREEN_BIT,
+        led_red_bit=SAW_LED_RED_BIT,
+        relay_open_bit=SAW_RELAY_OPEN_BIT,
+        relay_close_bit=SAW_RELAY_CLOSE_BIT,
+    ),
+    "lathe": GateConfig(
+        name="lathe",
+        event_on=EVT_LATHE_ON,
+        event_off=EVT_LATHE_OFF,
+        led_green_bit=LATHE_LED_GREEN_BIT,
+        led_red_bit=LATHE_LED_RED_BIT,
+        relay_open_bit=LATHE_RELAY_OPEN_BIT,
+        relay_close_bit=LATHE_RELAY_CLOSE_BIT,
+    ),
+}
+
+
+async def run_gate_controller(
+    bus: EventBus,
+    relays: PcfRelays,
+    relay_lock: asyncio.Lock,
+    name: str,
+) -> None:
+    """
+    Run the gate controller registered under `name` in GATE_CONFIGS:
+    - <name>.on  -> LED GREEN, drive OPEN for MAX_DRIVE_S then stop
+    - <name>.off -> LED RED,   drive CLOSE for MAX_DRIVE_S then stop
+
+    relay_lock MUST be shared across all controllers using relays@0x21.
+    """
+    controller = BaseGateController(bus, relays, relay_lock, GATE_CONFIGS[name])
+    await controller.run()
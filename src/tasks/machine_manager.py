@@ -1,6 +1,11 @@
 from __future__ import annotations
 import logging
-from ..events import Event
+from ..events import (
+    EVT_MACHINE_OFF,
+    EVT_MACHINE_ON,
+    EVT_SYSTEM_ANY_ACTIVE,
+    Event,
+)
 from ..event_bus import EventBus
 
 log = logging.getLogger("machine_manager")
@@ -12,13 +17,13 @@ async def machine_manager(bus: EventBus):
     log.info("machine_manager ready")
     while True:
         ev = await q.get()
-        if ev.type == "machine.on":
+        if ev.type == EVT_MACHINE_ON:
             tool = ev.data.get("tool")
             if tool:
                 active.add(tool)
-                await bus.publish(Event.now("system.any_active", "machine_manager", value=True, active=sorted(active)))
-        elif ev.type == "machine.off":
+                await bus.publish(Event.now(EVT_SYSTEM_ANY_ACTIVE, "machine_manager", value=True, active=sorted(active)))
+        elif ev.type == EVT_MACHINE_OFF:
             tool = ev.data.get("tool")
             if tool and tool in active:
                 active.remove(tool)
-            await bus.publish(Event.now("system.any_active", "machine_manager", value=bool(active), active=sorted(active)))
+            await bus.publish(Event.now(EVT_SYSTEM_ANY_ACTIVE, "machine_manager", value=bool(active), active=sorted(active)))
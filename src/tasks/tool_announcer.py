@@ -23,14 +23,31 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import random
 import shutil
-import subprocess
+import sys
 from pathlib import Path
 from typing import Any
 
 log = logging.getLogger("tool_announcer")
 
+_CATEGORIES = ("saw_on", "saw_off", "lathe_on", "lathe_off")
+
+# Events published by adc_watch -> announce(tool, state) arguments.
+# Keys are interned like Event.type (same objects as events.EVT_SAW_ON etc.;
+# not imported so this module still runs standalone), so lookups hit the
+# identity fast path.
+_EV_TO_ARGS: dict[str, tuple[str, str]] = {
+    sys.intern("saw.on"): ("saw", "on"),
+    sys.intern("saw.off"): ("saw", "off"),
+    sys.intern("lathe.on"): ("lathe", "on"),
+    sys.intern("lathe.off"): ("lathe", "off"),
+}
+
+# Clips kept per category; larger directories get a random subset at load.
+_MAX_FILES = 64
+
 
 class _ToolAnnouncer:
     """Plays random pre-generated audio files for tool on/off events."""
@@ -40,47 +57,72 @@ class _ToolAnnouncer:
         self._audio_dir = Path(audio_dir)
         self._player = player
         self._announce_probability = announce_probability
+        # Probability 1.0 / 0.0 need no random draw per event
+        self._prob_full = announce_probability >= 1.0
+        self._prob_zero = announce_probability <= 0.0
 
-        # Load audio files: _files["saw_on"] = [Path, Path, ...]
-        self._files: dict[str, list[Path]] = {}
-        self._load_all()
+        # Filled per category on first use: _files["saw_on"] = [path, ...]
+        self._files: dict[str, list[str]] = {}
         self._validate()
 
-    def _load_all(self) -> None:
-        """Load MP3 files for all tool/state combinations."""
-        for category in ("saw_on", "saw_off", "lathe_on", "lathe_off"):
-            cat_dir = self._audio_dir / category
-            if cat_dir.exists():
-                files = sorted(cat_dir.glob("*.mp3"))
-                self._files[category] = files
-                log.info("Loaded %d files from %s", len(files), cat_dir)
-            else:
-                self._files[category] = []
-                log.warning("Audio directory not found: %s", cat_dir)
+    def _get_files(self, category: str) -> list[str]:
+        """MP3 files for one tool/state category, scanned once on first use."""
+        files = self._files.get(category)
+        if files is not None:
+            return files
+
+        cat_dir = os.path.join(self._audio_dir, category)
+        # Unsorted is fine: the consumer picks at random
+        try:
+            with os.scandir(cat_dir) as it:
+                names = [
+                    e.name
+                    for e in it
+                    if e.name.endswith(".mp3") and e.is_file(follow_symlinks=False)
+                ]
+        except FileNotFoundError:
+            # Already warned about by _validate()
+            self._files[category] = []
+            return []
+        except OSError as e:
+            log.warning("Cannot list %s: %s", cat_dir, e)
+            self._files[category] = []
+            return []
+
+        if len(names) > _MAX_FILES:
+            names = random.sample(names, _MAX_FILES)
+        files = [os.path.join(cat_dir, name) for name in names]
+        self._files[category] = files
+        log.info("Loaded %d files from %s", len(files), cat_dir)
+        return files
 
     def _validate(self) -> None:
-        """Warn about any missing audio or player."""
-        for category, files in self._files.items():
-            if not files:
-                log.warning("No audio files found for: %s", category)
+        """Warn about any missing audio directory or player."""
+        # Only checks the directories exist; files are loaded on first use.
+        for category in _CATEGORIES:
+            cat_dir = self._audio_dir / category
+            if not cat_dir.is_dir():
+                log.warning("Audio directory not found: %s", cat_dir)
 
         if self._player == "mpg123" and shutil.which("mpg123") is None:
             log.error("mpg123 not found - install with: sudo apt-get install mpg123")
 
-    async def _play(self, filepath: Path) -> None:
+    async def _play(self, filepath: str) -> None:
         """Play a single MP3 file via mpg123."""
-        cmd = ["mpg123", "-q", "-a", "Z407", str(filepath)]
         try:
-            proc = await asyncio.to_thread(
-                subprocess.run,
-                cmd,
-                capture_output=True,
-                text=True,
-                check=False,
+            # Loop-native child process: no executor thread held for the clip
+            proc = await asyncio.create_subprocess_exec(
+                "mpg123", "-q", "-a", "Z407", filepath,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
             )
+            _out, err = await proc.communicate()
             if proc.returncode != 0:
-                err = (proc.stderr or "").strip()
-                log.error("mpg123 failed rc=%d err=%s", proc.returncode, err)
+                log.error(
+                    "mpg123 failed rc=%d err=%s",
+                    proc.returncode,
+                    err.decode(errors="replace").strip(),
+                )
         except Exception:
             log.exception("mpg123 playback failed")
 
@@ -93,19 +135,21 @@ class _ToolAnnouncer:
             state: "on" or "off"
         """
         # Probability gate
-        if random.random() > self._announce_probability:
+        if self._prob_zero or (
+            not self._prob_full and random.random() > self._announce_probability
+        ):
             log.debug("Announcement skipped (probability): %s %s", tool, state)
             return
 
         category = f"{tool}_{state}"
-        files = self._files.get(category, [])
+        files = self._get_files(category)
 
         if not files:
             log.warning("No audio files for: %s", category)
             return
 
-        chosen = random.choice(files)
-        log.info("Playing: %s", chosen.name)
+        chosen = files[random.randrange(len(files))]
+        log.info("Playing: %s", os.path.basename(chosen))
         await self._play(chosen)
 
 
@@ -166,21 +210,17 @@ async def run_tool_announcer(bus: Any, cfg: Any) -> None:
         announce_probability=probability,
     )
 
-    # Events: saw.on, saw.off, lathe.on, lathe.off (published by adc_watch)
-    supported_events = {"saw.on", "saw.off", "lathe.on", "lathe.off"}
-
-    q = bus.subscribe(maxsize=200)
+    q = bus.subscribe(maxsize=200, types=_EV_TO_ARGS)
+    get = q.get
+    lookup = _EV_TO_ARGS.get
+    announce = announcer.announce
 
     while True:
-        ev = await q.get()
-        ev_type = getattr(ev, "type", "")
-
-        if ev_type not in supported_events:
+        ev = await get()
+        args = lookup(getattr(ev, "type", ""))
+        if args is None:
             continue
-
-        # "saw.on" -> tool="saw", state="on"
-        tool, state = ev_type.split(".")
-        await announcer.announce(tool, state)
+        await announce(*args)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -188,8 +228,6 @@ async def run_tool_announcer(bus: Any, cfg: Any) -> None:
 # ─────────────────────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
-    import sys
-
     async def _test() -> None:
         audio_dir = sys.argv[1] if len(sys.argv) > 1 else "AudioCoolness"
         print(f"Tool Announcer Test - audio_dir={audio_dir}")